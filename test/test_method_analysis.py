@@ -0,0 +1,125 @@
+"""Focused unit tests for struct method body analysis."""
+
+from pathlib import Path
+
+from zinc.atlas import AtlasBuilder, StructMethodInfo
+from zinc.modules import build_module_graph
+from zinc.symbols import SymbolTableVisitor
+
+
+def analyze_methods(tmp_path: Path, source: str) -> dict[str, StructMethodInfo]:
+    """Resolve a small Zinc package and return its analyzed struct methods by name."""
+    pkg_dir = tmp_path / "pkg"
+    pkg_dir.mkdir()
+    (pkg_dir / "pkg.toml").write_text(
+        "\n".join(
+            [
+                "[package]",
+                'name = "tmp"',
+                'version = "0.1.0"',
+            ]
+        )
+    )
+    entry = pkg_dir / "main.zn"
+    entry.write_text(source)
+    module_graph = build_module_graph(entry)
+    atlas = AtlasBuilder(module_graph).build()
+    visitor = SymbolTableVisitor(atlas)
+    visitor.resolve()
+    return {method.name: method for struct in visitor.atlas.structs.values() for method in struct.methods}
+
+
+def test_early_return_does_not_stop_self_usage_or_parameter_inference(tmp_path: Path) -> None:
+    """Self usage and parameter hints after an early return still count, and the first return sets the type."""
+    methods = analyze_methods(
+        tmp_path,
+        """
+        struct Counter {
+            count: i64
+
+            fn bump(step) {
+                if step == 0 {
+                    return 0
+                }
+                self.count = self.count + step
+                return self.count
+            }
+
+            fn peek(flag: bool) {
+                if flag {
+                    return -1
+                }
+                return self.count
+            }
+
+            fn zero(step) {
+                if step == 0 {
+                    return 0
+                }
+                return step
+            }
+        }
+
+        fn main() {
+            c = Counter { count: 1 }
+            print(c.bump(2))
+            print(c.peek(false))
+            print(Counter.zero(3))
+        }
+        """,
+    )
+
+    bump = methods["bump"]
+    assert (bump.is_static, bump.self_mutability) == (False, "&mut self")
+    assert bump.parameters == [("step", None, "i64")]
+    assert bump.return_type == "i64"
+
+    peek = methods["peek"]
+    assert (peek.is_static, peek.self_mutability) == (False, "&self")
+    assert peek.return_type == "i64"
+
+    zero = methods["zero"]
+    assert (zero.is_static, zero.self_mutability) == (True, None)
+    assert zero.return_type == "i64"
+
+
+def test_return_type_comes_from_first_return_in_source_order_including_closures(tmp_path: Path) -> None:
+    """A typed return inside a closure is seen first, but returns nested in another return are skipped."""
+    methods = analyze_methods(
+        tmp_path,
+        """
+        struct Counter {
+            count: i64
+
+            fn describe() {
+                render = fn() {
+                    return "count"
+                }
+                return self.count
+            }
+
+            fn nested() {
+                render = fn() {
+                    return fn() {
+                        return 1.5
+                    }
+                }
+                return 1
+            }
+        }
+
+        fn main() {
+            c = Counter { count: 1 }
+            print(c.describe())
+            print(Counter.nested())
+        }
+        """,
+    )
+
+    describe = methods["describe"]
+    assert (describe.is_static, describe.self_mutability) == (False, "&self")
+    assert describe.return_type == "String"
+
+    nested = methods["nested"]
+    assert nested.is_static
+    assert nested.return_type == "i64"
@@ -4,6 +4,7 @@ from zinc.string_literals import (
     decode_string_literal,
     is_interpolated_string_literal,
     is_string_literal,
+    split_interpolations,
     to_rust_string_literal,
 )
 
@@ -35,3 +36,26 @@ def test_non_double_quoted_strings_lower_to_valid_rust_strings() -> None:
     assert to_rust_string_literal("'hello'") == 'r"hello"'
     assert to_rust_string_literal("`hello`") == 'r"hello"'
     assert to_rust_string_literal('`say "hi" and "#`').startswith('r##"')
+
+
+def test_split_interpolations_without_placeholders_returns_text_unchanged() -> None:
+    """Text with no interpolations passes through with no expressions."""
+    assert split_interpolations("hello") == ("hello", [])
+
+
+def test_split_interpolations_handles_adjacent_placeholders() -> None:
+    """Back-to-back interpolations each become their own placeholder, in order."""
+    assert split_interpolations("{a}{b}") == ("{}{}", ["a", "b"])
+    assert split_interpolations("x = {x}, y = {p.y[0]}") == ("x = {}, y = {}", ["x", "p.y[0]"])
+
+
+def test_split_interpolations_keeps_arbitrary_expressions_verbatim() -> None:
+    """Interpolation bodies are not limited to identifiers."""
+    assert split_interpolations("{1 + 2}") == ("{}", ["1 + 2"])
+
+
+def test_split_interpolations_leaves_unbalanced_and_empty_braces_alone() -> None:
+    """Only a non-empty {...} pair counts as an interpolation."""
+    assert split_interpolations("a {b") == ("a {b", [])
+    assert split_interpolations("a } b") == ("a } b", [])
+    assert split_interpolations("{}") == ("{}", [])
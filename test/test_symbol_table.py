@@ -0,0 +1,84 @@
+"""Focused unit tests for SymbolTable scoping and per-function symbol lookup."""
+
+from zinc.ast.types import BaseType
+from zinc.symbols import SymbolKind, SymbolTable
+
+
+def define_variable(table: SymbolTable, id: str, resolved_type: BaseType, start: int) -> object:
+    """Define a local variable at a distinct source interval."""
+    return table.define(id, SymbolKind.VARIABLE, resolved_type, (start, start))
+
+
+def test_nested_scope_shadowing_is_restored_on_exit() -> None:
+    """A shadow in a block hides the outer symbol only until the block closes."""
+    table = SymbolTable()
+    table.enter_scope("main")
+    outer = define_variable(table, "x", BaseType.INTEGER, 1)
+
+    table.enter_scope("if_0")
+    inner = define_variable(table, "x", BaseType.STRING, 2)
+    assert table.lookup_by_id("x") is inner
+    table.exit_scope()
+
+    assert table.lookup_by_id("x") is outer
+    table.exit_scope()
+    assert table.lookup_by_id("x") is None
+
+
+def test_redefinition_in_same_scope_replaces_visible_symbol() -> None:
+    """Redefining in one scope replaces the entry instead of stacking a second shadow."""
+    table = SymbolTable()
+    table.enter_scope("main")
+    outer = define_variable(table, "x", BaseType.INTEGER, 1)
+
+    table.enter_scope("for_0")
+    define_variable(table, "x", BaseType.INTEGER, 2)
+    latest = define_variable(table, "x", BaseType.STRING, 3)
+    assert table.lookup_by_id("x") is latest
+    table.exit_scope()
+
+    # Both block definitions go away together, exposing the function-level symbol again.
+    assert table.lookup_by_id("x") is outer
+
+
+def test_function_symbols_excludes_functions_sharing_a_name_prefix() -> None:
+    """function_symbols("a") must not pick up symbols from functions named "a.b" or "ab"."""
+    table = SymbolTable()
+    owned = []
+    for function_scope in ("a", "a.b", "ab"):
+        table.enter_scope(function_scope)
+        symbol = define_variable(table, "x", BaseType.INTEGER, len(owned))
+        if function_scope == "a":
+            owned.append(symbol)
+            table.enter_scope("if_0")
+            owned.append(define_variable(table, "y", BaseType.INTEGER, 10))
+            table.exit_scope()
+        table.exit_scope()
+
+    assert table.function_symbols("a") == owned
+    assert [symbol.unique_name for symbol in table.function_symbols("a.b")] == ["a.b.x/i64"]
+    assert [symbol.unique_name for symbol in table.function_symbols("ab")] == ["ab.x/i64"]
+    assert table.function_symbols("missing") == []
+
+
+def test_function_symbols_matches_all_symbols_scan_with_latest_definition_last() -> None:
+    """The per-function index keeps the order of the old all_symbols() prefix scan."""
+    table = SymbolTable()
+    table.define("print", SymbolKind.BUILTIN, BaseType.VOID, (0, 0))
+    for function_scope in ("main", "helper"):
+        table.enter_scope(function_scope)
+        define_variable(table, "x", BaseType.INTEGER, 1)
+        table.define_temp(BaseType.INTEGER, (2, 2))
+        table.enter_scope("while_0")
+        define_variable(table, "x", BaseType.FLOAT, 3)
+        table.exit_scope()
+        define_variable(table, "x", BaseType.STRING, 4)
+        table.exit_scope()
+
+    for function_scope in ("main", "helper"):
+        prefix = f"{function_scope}."
+        scanned = [symbol for symbol in table.all_symbols() if symbol.unique_name.startswith(prefix)]
+        assert table.function_symbols(function_scope) == scanned
+        # Codegen walks the list in reverse, so the latest definition of a name must win.
+        latest = next(symbol for symbol in reversed(table.function_symbols(function_scope)) if symbol.id == "x")
+        assert latest.unique_name == f"{function_scope}.x/String"
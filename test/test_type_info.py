@@ -0,0 +1,26 @@
+"""Focused unit tests for the shared legacy TypeInfo instances."""
+
+import dataclasses
+
+import pytest
+from zinc.ast.types import BaseType, TypeInfo
+
+
+def test_type_info_of_returns_one_shared_instance_per_base_type() -> None:
+    """TypeInfo.of() and promote() hand out the same instance for a base type."""
+    for base in BaseType:
+        assert TypeInfo.of(base) is TypeInfo.of(base)
+    integer = TypeInfo.of(BaseType.INTEGER)
+    float_ = TypeInfo.of(BaseType.FLOAT)
+    assert TypeInfo.promote(integer, integer) is integer
+    assert TypeInfo.promote(integer, float_) is float_
+
+
+def test_shared_type_info_cannot_be_mutated() -> None:
+    """A write through one holder must not be able to retarget every other holder."""
+    shared = TypeInfo.of(BaseType.INTEGER)
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        shared.base = BaseType.STRING  # type: ignore[misc]
+
+    assert TypeInfo.of(BaseType.INTEGER).base is BaseType.INTEGER
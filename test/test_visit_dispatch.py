@@ -0,0 +1,59 @@
+"""Focused unit tests for the cached visitX dispatch used by the compiler visitors."""
+
+import inspect
+
+import pytest
+from antlr4 import ParserRuleContext
+from zinc.codegen import CodeGenVisitor
+from zinc.parser.zincParser import zincParser as ZincParser
+from zinc.symbols import _VISIT_HANDLERS, SymbolTableVisitor, dispatch_visit
+
+CONTEXT_TYPES = [
+    context_type
+    for _, context_type in inspect.getmembers(ZincParser, inspect.isclass)
+    if issubclass(context_type, ParserRuleContext) and "accept" in context_type.__dict__
+]
+
+
+def recording_visitor_type(visitor_type: type) -> type:
+    """Return a subclass whose visit methods only record their own name."""
+
+    def recorder(name: str):
+        def record(self, node):
+            self.calls.append(name)
+
+        return record
+
+    overrides = {name: recorder(name) for name in dir(visitor_type) if name.startswith("visit") and name != "visit"}
+    return type(f"Recording{visitor_type.__name__}", (visitor_type,), overrides)
+
+
+def new_recorder(recording_type: type) -> object:
+    """Create a recorder without running the real visitor's compiler-state setup."""
+    visitor = object.__new__(recording_type)
+    visitor.calls = []
+    return visitor
+
+
+def test_every_grammar_context_is_covered() -> None:
+    """Sanity check that the generated parser exposes its context classes."""
+    assert len(CONTEXT_TYPES) > 50
+
+
+@pytest.mark.parametrize("visitor_type", [SymbolTableVisitor, CodeGenVisitor])
+def test_dispatch_visit_calls_the_same_method_as_accept(visitor_type: type) -> None:
+    """Every context must reach the visitX method its generated accept() would call, not a visitChildren fallback."""
+    recording_type = recording_visitor_type(visitor_type)
+    for context_type in CONTEXT_TYPES:
+        node = object.__new__(context_type)
+        expected = f"visit{context_type.__name__.removesuffix('Context')}"
+
+        via_accept = new_recorder(recording_type)
+        node.accept(via_accept)
+        via_dispatch = new_recorder(recording_type)
+        dispatch_visit(via_dispatch, node)
+
+        # The name mapping must resolve a handler itself rather than falling back to accept().
+        assert _VISIT_HANDLERS[recording_type][context_type] is getattr(recording_type, expected), context_type.__name__
+        assert via_accept.calls == [expected], context_type.__name__
+        assert via_dispatch.calls == via_accept.calls, context_type.__name__
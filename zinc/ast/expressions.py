@@ -4,6 +4,8 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from typing import Optional
 
+from zinc.string_literals import split_interpolations
+
 from .types import ArrayTypeInfo, BaseType, ChannelTypeInfo, TypeInfo, type_to_rust
 
 
@@ -23,29 +25,23 @@ class LiteralExpr(Expression):
     """Literal value (integer, float, string, boolean)."""
 
     value: str
-    type_info: TypeInfo = field(default_factory=lambda: TypeInfo(BaseType.UNKNOWN))
+    type_info: TypeInfo = field(default_factory=lambda: TypeInfo.of(BaseType.UNKNOWN))
 
     def render_rust(self) -> str:
         # Handle format string interpolation like "{self.a}" or "{var}"
         if self.type_info and self.type_info.base == BaseType.STRING:
-            import re
-
-            interpolations = re.findall(r"\{([^}]+)\}", self.value)
+            format_string, interpolations = split_interpolations(self.value)
             if interpolations:
                 # Convert to format!() macro
-                format_string = re.sub(r"\{[^}]+\}", "{}", self.value)
                 args = ", ".join(interpolations)
                 return f"format!({format_string}, {args})"
         return self.value
 
     def render_rust_as_string(self) -> str:
         """Render as an owned String (for struct fields expecting String type)."""
-        import re
-
         # Check for format string interpolation
-        interpolations = re.findall(r"\{([^}]+)\}", self.value)
+        format_string, interpolations = split_interpolations(self.value)
         if interpolations:
-            format_string = re.sub(r"\{[^}]+\}", "{}", self.value)
             args = ", ".join(interpolations)
             return f"format!({format_string}, {args})"
         # Wrap with String::from()
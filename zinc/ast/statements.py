@@ -1,12 +1,13 @@
 """Statement AST nodes for the Zinc compiler."""
 
-import re
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from enum import Enum, auto
 from typing import Optional, Union
 
-from .expressions import Expression
+from zinc.string_literals import split_interpolations
+
+from .expressions import ArrayLiteralExpr, Expression, RangeExpr
 from .types import BaseType, type_to_rust
 
 
@@ -21,13 +22,15 @@ class AssignmentKind(Enum):
 class Statement(ABC):
     """Base class for all statement nodes."""
 
+    __slots__ = ()
+
     @abstractmethod
     def render(self) -> str:
         """Generate Rust code for this statement."""
         pass
 
 
-@dataclass
+@dataclass(slots=True)
 class VariableAssignment(Statement):
     """Variable assignment statement."""
 
@@ -50,8 +53,6 @@ class VariableAssignment(Statement):
             mut = "mut " if self.needs_mut else ""
 
             # Special case for empty Vec needing type annotation
-            from .expressions import ArrayLiteralExpr
-
             if isinstance(self.value, ArrayLiteralExpr):
                 if self.value.array_info and self.value.array_info.is_vector:
                     if not self.value.elements:
@@ -61,7 +62,7 @@ class VariableAssignment(Statement):
             return f"let {mut}{self.variable_name} = {value_code};"
 
 
-@dataclass
+@dataclass(slots=True)
 class PrintStatement(Statement):
     """Print statement."""
 
@@ -79,31 +80,24 @@ class PrintStatement(Statement):
             format_string = first_arg.render_rust()
 
         # Remove surrounding quotes if present
-        if format_string.startswith('"') and format_string.endswith('"'):
-            format_string = format_string[1:-1]
-        elif format_string.startswith("'") and format_string.endswith("'"):
+        quote = format_string[:1]
+        if quote in ("'", '"') and format_string[-1] == quote:
             format_string = format_string[1:-1]
 
-        # Extract expressions from {expr} patterns
+        # Extract expressions from {expr} patterns and replace them with {} for Rust's println! macro
         # Match both simple vars {var} and indexed access {var[index]}
-        expr_pattern = r"\{([^}]+)\}"
-        expressions = re.findall(expr_pattern, format_string)
+        rust_format_string, expressions = split_interpolations(format_string)
 
         # If there are expressions, render as println! with format args
         if expressions:
-            # Replace {expr} with {} for Rust's println! macro
-            rust_format_string = re.sub(expr_pattern, "{}", format_string)
-            args_str = f'"{rust_format_string}"'
             # Add the expressions as additional arguments
-            for expr in expressions:
-                args_str += f", {expr}"
-            return f"println!({args_str});"
+            return f'println!("{rust_format_string}", {", ".join(expressions)});'
         else:
             # No expressions, just a plain string
             return f'println!("{format_string}");'
 
 
-@dataclass
+@dataclass(slots=True)
 class ExpressionStatement(Statement):
     """Standalone expression (e.g., function call)."""
 
@@ -113,7 +107,7 @@ class ExpressionStatement(Statement):
         return f"{self.expression.render_rust()};"
 
 
-@dataclass
+@dataclass(slots=True)
 class IfBranch:
     """A single if/else-if branch with condition and body."""
 
@@ -121,7 +115,7 @@ class IfBranch:
     body: list["Statement"]
 
 
-@dataclass
+@dataclass(slots=True)
 class IfStatement(Statement):
     """If/else statement."""
 
@@ -134,24 +128,18 @@ class IfStatement(Statement):
             keyword = "if" if i == 0 else "} else if"
             cond = branch.condition.render_rust()
             lines.append(f"{keyword} {cond} {{")
-            for stmt in branch.body:
-                # Handle multi-line statements (like nested if)
-                stmt_lines = stmt.render().split("\n")
-                for stmt_line in stmt_lines:
-                    lines.append(f"    {stmt_line}")
+            # Handle multi-line statements (like nested if) by indenting every line
+            lines.extend("    " + stmt.render().replace("\n", "\n    ") for stmt in branch.body)
 
         if self.else_body:
             lines.append("} else {")
-            for stmt in self.else_body:
-                stmt_lines = stmt.render().split("\n")
-                for stmt_line in stmt_lines:
-                    lines.append(f"    {stmt_line}")
+            lines.extend("    " + stmt.render().replace("\n", "\n    ") for stmt in self.else_body)
 
         lines.append("}")
         return "\n".join(lines)
 
 
-@dataclass
+@dataclass(slots=True)
 class Parameter:
     """Function parameter."""
 
@@ -160,7 +148,7 @@ class Parameter:
     resolved_type: Optional[str] = None  # Resolved type from monomorphization
 
 
-@dataclass
+@dataclass(slots=True)
 class FunctionDeclaration(Statement):
     """Function declaration."""
 
@@ -198,14 +186,12 @@ class FunctionDeclaration(Statement):
         async_kw = "async " if self.is_async else ""
 
         lines = [f"{async_kw}fn {func_name}({params}){ret_type} {{"]
-        for stmt in self.body:
-            for line in stmt.render().split("\n"):
-                lines.append(f"    {line}")
+        lines.extend("    " + stmt.render().replace("\n", "\n    ") for stmt in self.body)
         lines.append("}")
         return "\n".join(lines)
 
 
-@dataclass
+@dataclass(slots=True)
 class ReturnStatement(Statement):
     """Return statement."""
 
@@ -217,7 +203,7 @@ class ReturnStatement(Statement):
         return "return;"
 
 
-@dataclass
+@dataclass(slots=True)
 class SpawnStatement(Statement):
     """Spawn statement for concurrent execution."""
 
@@ -228,7 +214,7 @@ class SpawnStatement(Statement):
         return f"tokio::spawn({call});"
 
 
-@dataclass
+@dataclass(slots=True)
 class ChannelSendStatement(Statement):
     """Channel send statement: sender <- value."""
 
@@ -246,7 +232,7 @@ class ChannelSendStatement(Statement):
             return f"{self.channel_name}.send({val}).unwrap();"
 
 
-@dataclass
+@dataclass(slots=True)
 class ChannelDeclaration(Statement):
     """Channel creation with destructuring: let (tx, rx) = chan()."""
 
@@ -267,7 +253,7 @@ class ChannelDeclaration(Statement):
         return f"let ({self.sender_name}, mut {self.receiver_name}) = tokio::sync::mpsc::unbounded_channel::<{elem}>();"
 
 
-@dataclass
+@dataclass(slots=True)
 class MethodCallStatement(Statement):
     """Standalone method call: b.push(10)."""
 
@@ -280,7 +266,7 @@ class MethodCallStatement(Statement):
         return f"{self.target.render_rust()}.{self.method_name}({args});"
 
 
-@dataclass
+@dataclass(slots=True)
 class ForStatement(Statement):
     """For-in loop statement."""
 
@@ -289,8 +275,6 @@ class ForStatement(Statement):
     body: list["Statement"]
 
     def render(self) -> str:
-        from .expressions import RangeExpr
-
         if isinstance(self.iterable, RangeExpr):
             # Ranges are consumed, no & needed
             iter_code = self.iterable.render_rust()
@@ -299,9 +283,6 @@ class ForStatement(Statement):
             iter_code = f"&{self.iterable.render_rust()}"
 
         lines = [f"for {self.loop_variable} in {iter_code} {{"]
-        for stmt in self.body:
-            stmt_lines = stmt.render().split("\n")
-            for stmt_line in stmt_lines:
-                lines.append(f"    {stmt_line}")
+        lines.extend("    " + stmt.render().replace("\n", "\n    ") for stmt in self.body)
         lines.append("}")
         return "\n".join(lines)
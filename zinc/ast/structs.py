@@ -4,7 +4,7 @@ from dataclasses import dataclass, field
 from enum import Enum, auto
 from typing import Optional
 
-from .expressions import Expression
+from .expressions import Expression, LiteralExpr
 from .statements import Parameter, Statement
 from .types import BaseType, TypeInfo, type_to_rust
 
@@ -92,9 +92,7 @@ class StructMethod:
         ret_type = f" -> {self.return_type}" if self.return_type else ""
 
         lines = [f"fn {self.name}({params}){ret_type} {{"]
-        for stmt in self.body:
-            for line in stmt.render().split("\n"):
-                lines.append(f"    {line}")
+        lines.extend("    " + stmt.render().replace("\n", "\n    ") for stmt in self.body)
         lines.append("}")
         return "\n".join(lines)
 
@@ -125,9 +123,7 @@ class StructDeclaration(Statement):
         if renderable_methods:
             lines.append(f"impl {self.name} {{")
             for method in renderable_methods:
-                method_code = method.render(self.name)
-                for line in method_code.split("\n"):
-                    lines.append(f"    {line}")
+                lines.append("    " + method.render(self.name).replace("\n", "\n    "))
                 lines.append("")
             lines.append("}")
 
@@ -144,8 +140,6 @@ class StructInstantiationExpr(Expression):
     struct_decl: Optional[StructDeclaration] = None  # Reference to struct definition
 
     def render_rust(self) -> str:
-        from .expressions import LiteralExpr
-
         lines = [f"{self.struct_name} {{"]
 
         # If we have struct_decl, include all fields with defaults
@@ -208,8 +202,6 @@ class StaticMethodCallExpr(Expression):
     struct_decl: Optional["StructDeclaration"] = None  # Reference to struct definition
 
     def render_rust(self) -> str:
-        from .expressions import LiteralExpr
-
         args_rendered = []
         for i, arg in enumerate(self.arguments):
             # Check if we should convert string literal to String::from()
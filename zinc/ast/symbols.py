@@ -18,6 +18,8 @@ class Symbol(NamedTuple):
 class Scope:
     """A scope in the symbol table, supporting nested scopes."""
 
+    __slots__ = ("parent", "_symbols", "children", "function")
+
     def __init__(self, parent: Optional["Scope"] = None):
         self.parent = parent
         self._symbols: dict[str, Symbol] = {}
@@ -32,10 +34,12 @@ class Scope:
 
     def lookup(self, name: str) -> Optional[Symbol]:
         """Look up a symbol by name, searching parent scopes."""
-        if name in self._symbols:
-            return self._symbols[name]
-        elif self.parent:
-            return self.parent.lookup(name)
+        scope = self
+        while scope is not None:
+            sym = scope._symbols.get(name)
+            if sym is not None:
+                return sym
+            scope = scope.parent
         return None
 
     def lookup_local(self, name: str) -> Optional[Symbol]:
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from enum import Enum, auto
+from functools import lru_cache
 
 from zinc.string_literals import is_string_literal
 
@@ -30,24 +31,30 @@ class BaseType(Enum):
     NEVER = auto()  # Diverging control flow that never completes normally
     UNKNOWN = auto()  # For unresolved types
 
+    # Members are singletons compared by identity; hash by identity too instead of Enum's Python-level name hash.
+    __hash__ = object.__hash__
+
     def __repr__(self):
         return self.name
 
 
+@dataclass(frozen=True, slots=True)
 class TypeInfo:
-    """Rich type information with promotion support."""
+    """Rich type information with promotion support.
 
-    def __init__(self, base: BaseType):
-        self.base = base
+    Frozen because TypeInfo.of() and promote() hand out one shared instance per base type.
+    """
 
-    def __eq__(self, other):
-        if isinstance(other, TypeInfo):
-            return self.base == other.base
-        return False
+    base: BaseType
 
     def __repr__(self):
         return f"TypeInfo({self.base})"
 
+    @staticmethod
+    def of(base: BaseType) -> "TypeInfo":
+        """Return the shared TypeInfo for a base type."""
+        return _TYPE_INFO_CACHE[base]
+
     @staticmethod
     def promote(left: "TypeInfo", right: "TypeInfo") -> "TypeInfo":
         """Determine result type for binary operation.
@@ -58,30 +65,41 @@ class TypeInfo:
         - int + float -> float (promote int to float)
         """
         if left.base == right.base:
-            return TypeInfo(left.base)
+            return _TYPE_INFO_CACHE[left.base]
 
         # int + float -> float
         if {left.base, right.base} == {BaseType.INTEGER, BaseType.FLOAT}:
-            return TypeInfo(BaseType.FLOAT)
+            return _TYPE_INFO_CACHE[BaseType.FLOAT]
 
         # Default: unknown (should trigger error in validation phase)
-        return TypeInfo(BaseType.UNKNOWN)
+        return _TYPE_INFO_CACHE[BaseType.UNKNOWN]
+
 
+# TypeInfo is frozen and only wraps a BaseType, so one instance per base type is shared.
+_TYPE_INFO_CACHE: dict[BaseType, TypeInfo] = {base: TypeInfo(base) for base in BaseType}
 
+
+@lru_cache(maxsize=1024)
 def parse_literal(literal_text: str) -> BaseType:
-    """Parse a literal string and return its type."""
+    """Parse a literal string and return its type.
+
+    Memoized because the same small literals (0, 1, true, "") recur throughout a program.
+    """
     from zinc.numeric_literals import parse_numeric_literal
 
-    if is_string_literal(literal_text):
-        return BaseType.STRING
-    if literal_text in ("true", "false"):
-        return BaseType.BOOLEAN
+    # Numbers are the common case and always start with a digit; skip the string and bool probes for them.
+    if not literal_text[:1].isdigit():
+        if is_string_literal(literal_text):
+            return BaseType.STRING
+        if literal_text in ("true", "false"):
+            return BaseType.BOOLEAN
     parsed = parse_numeric_literal(literal_text)
     if parsed is not None:
         return parsed.base_type
     raise ValueError(f"Unknown literal type: {literal_text}")
 
 
+@lru_cache(maxsize=None)
 def type_to_rust(base_type: BaseType) -> str:
     """Convert a BaseType to its Rust type name."""
     mapping = {
@@ -107,75 +125,81 @@ def type_to_rust(base_type: BaseType) -> str:
     return mapping.get(base_type, "unknown")
 
 
+_NORMALIZED_EXACT_TYPES: dict[str, str] = {
+    "i8": "i8",
+    "i16": "i16",
+    "i32": "i32",
+    "i64": "i64",
+    "i128": "i128",
+    "u8": "u8",
+    "u16": "u16",
+    "u32": "u32",
+    "u64": "u64",
+    "u128": "u128",
+    "usize": "usize",
+    "isize": "isize",
+    "f8": "f8",
+    "f16": "f16",
+    "f32": "f32",
+    "f64": "f64",
+    "f128": "f128",
+    "string": "String",
+    "String": "String",
+    "bool": "bool",
+    "Context": "Context",
+    "context": "Context",
+}
+
+
 def normalize_exact_type(type_name: str | None) -> str | None:
     """Normalize a scalar exact type name to the Rust spelling used in codegen."""
     if type_name is None:
         return None
-    mapping = {
-        "i8": "i8",
-        "i16": "i16",
-        "i32": "i32",
-        "i64": "i64",
-        "i128": "i128",
-        "u8": "u8",
-        "u16": "u16",
-        "u32": "u32",
-        "u64": "u64",
-        "u128": "u128",
-        "usize": "usize",
-        "isize": "isize",
-        "f8": "f8",
-        "f16": "f16",
-        "f32": "f32",
-        "f64": "f64",
-        "f128": "f128",
-        "string": "String",
-        "String": "String",
-        "bool": "bool",
-        "Context": "Context",
-        "context": "Context",
-    }
-    return mapping.get(type_name, type_name)
+    return _NORMALIZED_EXACT_TYPES.get(type_name, type_name)
+
+
+_EXACT_TYPE_BASES: dict[str, BaseType] = {
+    "i8": BaseType.INTEGER,
+    "i16": BaseType.INTEGER,
+    "i32": BaseType.INTEGER,
+    "i64": BaseType.INTEGER,
+    "i128": BaseType.INTEGER,
+    "u8": BaseType.INTEGER,
+    "u16": BaseType.INTEGER,
+    "u32": BaseType.INTEGER,
+    "u64": BaseType.INTEGER,
+    "u128": BaseType.INTEGER,
+    "usize": BaseType.INTEGER,
+    "isize": BaseType.INTEGER,
+    "f8": BaseType.FLOAT,
+    "f16": BaseType.FLOAT,
+    "f32": BaseType.FLOAT,
+    "f64": BaseType.FLOAT,
+    "f128": BaseType.FLOAT,
+    "String": BaseType.STRING,
+    "bool": BaseType.BOOLEAN,
+    "Context": BaseType.CONTEXT,
+}
 
 
 def exact_type_to_base(type_name: str | None) -> BaseType:
     """Map an exact scalar type name to a Zinc base type."""
     normalized = normalize_exact_type(type_name)
-    mapping = {
-        "i8": BaseType.INTEGER,
-        "i16": BaseType.INTEGER,
-        "i32": BaseType.INTEGER,
-        "i64": BaseType.INTEGER,
-        "i128": BaseType.INTEGER,
-        "u8": BaseType.INTEGER,
-        "u16": BaseType.INTEGER,
-        "u32": BaseType.INTEGER,
-        "u64": BaseType.INTEGER,
-        "u128": BaseType.INTEGER,
-        "usize": BaseType.INTEGER,
-        "isize": BaseType.INTEGER,
-        "f8": BaseType.FLOAT,
-        "f16": BaseType.FLOAT,
-        "f32": BaseType.FLOAT,
-        "f64": BaseType.FLOAT,
-        "f128": BaseType.FLOAT,
-        "String": BaseType.STRING,
-        "bool": BaseType.BOOLEAN,
-        "Context": BaseType.CONTEXT,
-    }
-    return mapping.get(normalized, BaseType.UNKNOWN)
+    return _EXACT_TYPE_BASES.get(normalized, BaseType.UNKNOWN)
+
+
+_DEFAULT_EXACT_TYPES: dict[BaseType, str] = {
+    BaseType.INTEGER: "i64",
+    BaseType.FLOAT: "f64",
+    BaseType.STRING: "String",
+    BaseType.BOOLEAN: "bool",
+    BaseType.CONTEXT: "Context",
+}
 
 
 def default_exact_type(base_type: BaseType) -> str | None:
     """Return the default exact scalar type used for unannotated primitive values."""
-    mapping = {
-        BaseType.INTEGER: "i64",
-        BaseType.FLOAT: "f64",
-        BaseType.STRING: "String",
-        BaseType.BOOLEAN: "bool",
-        BaseType.CONTEXT: "Context",
-    }
-    return mapping.get(base_type)
+    return _DEFAULT_EXACT_TYPES.get(base_type)
 
 
 def exact_type_to_rust(exact_type: str | None, base_type: BaseType) -> str:
@@ -831,10 +855,15 @@ class CallableTarget:
     receiver_name: str | None = None
     receiver_struct_qualified_name: str | None = None
     receiver_mutability: str | None = None
+    _storage_key: tuple[str, str, str | None] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Build the dedupe key once; the target is immutable."""
+        object.__setattr__(self, "_storage_key", (self.kind, self.qualified_name, self.receiver_name))
 
     def storage_key(self) -> tuple[str, str, str | None]:
         """Return a stable key for deduping targets."""
-        return (self.kind, self.qualified_name, self.receiver_name)
+        return self._storage_key
 
 
 @dataclass
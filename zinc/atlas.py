@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import re
+from collections.abc import Sequence
 from dataclasses import dataclass, field
 
 from antlr4 import ParserRuleContext
@@ -32,7 +33,7 @@ from zinc.modules import (
     struct_path_from_ctx,
 )
 from zinc.parser.zincParser import zincParser as ZincParser
-from zinc.string_literals import is_string_literal, to_rust_string_literal
+from zinc.string_literals import INTERPOLATION_NAME_PATTERN, INTERPOLATION_PATTERN, is_string_literal, to_rust_string_literal
 
 CompositionMode = str
 NUMERIC_TYPE_ALTERNATIVES = (
@@ -97,7 +98,7 @@ class FunctionInstance:
     decorator_applications: list[ResolvedDecoratorApplication] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class StructFieldInfo:
     """Analyzed struct field information."""
 
@@ -199,7 +200,7 @@ class StructFieldInfo:
         return defaults.get(self.rust_type(), "Default::default()")
 
 
-@dataclass
+@dataclass(slots=True)
 class StructMethodInfo:
     """Analyzed struct method information."""
 
@@ -238,7 +239,7 @@ class StructInstance:
     has_decorators: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class EnumVariantInfo:
     """Analyzed enum variant information."""
 
@@ -292,6 +293,12 @@ class Atlas:
     enum_usages: SortedDict[str, SortedSet[str]] = field(default_factory=SortedDict)
     const_usages: SortedDict[str, SortedSet[str]] = field(default_factory=SortedDict)
     function_defs: SortedDict[str, ParserRuleContext] = field(default_factory=SortedDict)
+    # Mangled names for plain scalar signatures, keyed by (qualified_name, ctx, arg_types, arg_exact_types).
+    _specialization_cache: dict[tuple[object, ...], str] = field(default_factory=dict, init=False, repr=False, compare=False)
+    # Declared parameter exact types per (function ctx, source module), shared across specializations.
+    _annotated_param_cache: dict[tuple[ParserRuleContext, str | None], tuple[tuple[int, str], ...]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
 
     def is_reachable(self, name: str) -> bool:
         """Check if a function, struct, enum, or const is reachable."""
@@ -316,6 +323,26 @@ class Atlas:
         arg_anonymous_struct_infos: dict[int, AnonymousStructTypeInfo] | None = None,
     ) -> str:
         """Create a new function specialization and return its mangled name."""
+        has_type_infos = bool(
+            arg_channel_infos
+            or arg_array_infos
+            or arg_dict_infos
+            or arg_set_infos
+            or arg_tuple_infos
+            or arg_callable_infos
+            or arg_result_infos
+            or arg_option_infos
+            or arg_struct_qualified_names
+            or arg_anonymous_struct_infos
+        )
+        cache_key = None
+        if not has_type_infos:
+            cache_key = (qualified_name, ctx, tuple(arg_types), tuple(arg_exact_types))
+            cached = self._specialization_cache.get(cache_key)
+            if cached is not None and cached in self.functions:
+                if caller_mangled and caller_mangled in self.calls:
+                    self.calls[caller_mangled].add(cached)
+                return cached
         source_module_id = qualified_name.split("::", 1)[0] if "::" in qualified_name else None
         effective_arg_exact_types = self._specialization_arg_exact_types(
             ctx,
@@ -396,6 +423,8 @@ class Atlas:
         if caller_mangled and caller_mangled in self.calls:
             self.calls[caller_mangled].add(mangled)
 
+        if cache_key is not None:
+            self._specialization_cache[cache_key] = mangled
         return mangled
 
     def _specialization_arg_exact_types(
@@ -406,8 +435,30 @@ class Atlas:
     ) -> list[str | None]:
         """Use declared scalar annotations for specialization identity when present."""
         exact_types = list(arg_exact_types)
+        for i, annotated_exact_type in self._annotated_param_exact_types(ctx, source_module_id):
+            while len(exact_types) <= i:
+                exact_types.append(None)
+            exact_types[i] = annotated_exact_type
+        return exact_types
+
+    def _annotated_param_exact_types(
+        self,
+        ctx: ParserRuleContext,
+        source_module_id: str | None,
+    ) -> tuple[tuple[int, str], ...]:
+        """Return (index, exact type) for each parameter with one declared scalar/enum annotation.
+
+        Annotations only depend on the definition, so the result is computed once per function ctx
+        and shared by every specialization of it.
+        """
+        cache_key = (ctx, source_module_id)
+        cached = self._annotated_param_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        annotated: list[tuple[int, str]] = []
         if not hasattr(ctx, "parameterList") or ctx.parameterList() is None:
-            return exact_types
+            self._annotated_param_cache[cache_key] = ()
+            return ()
         for i, param_ctx in enumerate(ctx.parameterList().parameter()):
             type_ctxs = list(param_ctx.typeAlternative().type_()) if param_ctx.typeAlternative() is not None else []
             if len(type_ctxs) != 1 or type_ctxs[0].getText() == "numeric":
@@ -429,10 +480,10 @@ class Atlas:
                     annotated_exact_type = resolved_enum.qualified_name
             if annotated_exact_type is None:
                 continue
-            while len(exact_types) <= i:
-                exact_types.append(None)
-            exact_types[i] = annotated_exact_type
-        return exact_types
+            annotated.append((i, annotated_exact_type))
+        result = tuple(annotated)
+        self._annotated_param_cache[cache_key] = result
+        return result
 
     def _mangle_name(
         self,
@@ -565,6 +616,8 @@ class AtlasBuilder:
         self._const_usages: SortedDict[str, SortedSet[str]] = SortedDict()
         self._current_function: str | None = None
         self._current_module: str | None = None
+        # Non-builtin function targets per (module, call path); None when the path is not such a function.
+        self._call_targets: dict[tuple[str, tuple[str, ...]], str | None] = {}
 
     def build(self) -> Atlas:
         """Build the Atlas after loading the full module graph."""
@@ -631,10 +684,21 @@ class AtlasBuilder:
         if ctx is None or self._current_function is None or self._current_module is None:
             return
 
+        # Explicit pre-order stack: function bodies can nest deeply, and recursing per parse node costs a frame each.
+        stack = [ctx]
+        while stack:
+            node = stack.pop()
+            self._record_references(node)
+            children = node.children
+            if children:
+                stack.extend(child for child in reversed(children) if isinstance(child, ParserRuleContext))
+
+    def _record_references(self, ctx: ParserRuleContext) -> None:
+        """Record the top-level references made directly by one parse node."""
         for decorator in decorators_from_ctx(ctx):
-            func_symbol = self.module_graph.resolve_function_path(self._current_module, list(decorator.path))
-            if func_symbol and func_symbol.name not in self.BUILTIN_FUNCTIONS:
-                self._calls[self._current_function].add(func_symbol.qualified_name)
+            callee = self._call_target(decorator.path)
+            if callee:
+                self._calls[self._current_function].add(callee)
 
         if isinstance(ctx, ZincParser.PrimaryExpressionContext) and ctx.IDENTIFIER():
             symbol = self.module_graph.resolve_const_path(self._current_module, [ctx.IDENTIFIER().getText()])
@@ -643,8 +707,8 @@ class AtlasBuilder:
 
         if isinstance(ctx, ZincParser.LiteralContext) and ctx.STRING():
             text = ctx.STRING().getText()[1:-1]
-            for expr in re.findall(r"\{([^}]+)\}", text):
-                for token in re.findall(r"\b[A-Za-z_][A-Za-z0-9_]*(?:\.[A-Za-z_][A-Za-z0-9_]*)*\b", expr):
+            for expr in INTERPOLATION_PATTERN.findall(text):
+                for token in INTERPOLATION_NAME_PATTERN.findall(expr):
                     path = token.split(".")
                     const_symbol = self.module_graph.resolve_const_path(self._current_module, path)
                     if const_symbol:
@@ -668,31 +732,29 @@ class AtlasBuilder:
         if isinstance(ctx, ZincParser.FunctionCallExprContext):
             path = extract_identifier_path(ctx.expression())
             if path:
-                func_symbol = self.module_graph.resolve_function_path(self._current_module, path)
-                if func_symbol and func_symbol.name not in self.BUILTIN_FUNCTIONS:
-                    self._calls[self._current_function].add(func_symbol.qualified_name)
+                callee = self._call_target(path)
+                if callee:
+                    self._calls[self._current_function].add(callee)
                 else:
                     static_target = self.module_graph.resolve_static_method_target(self._current_module, path)
                     if static_target:
                         type_symbol, method_name = static_target
                         self._add_type_usage(type_symbol.qualified_name, method_name)
             if isinstance(ctx.expression(), ZincParser.MemberAccessExprContext):
-                member_name = ctx.expression().IDENTIFIER().getText()
-                func_symbol = self.module_graph.resolve_function_path(self._current_module, [member_name])
-                if func_symbol and func_symbol.name not in self.BUILTIN_FUNCTIONS:
-                    self._calls[self._current_function].add(func_symbol.qualified_name)
+                callee = self._call_target((ctx.expression().IDENTIFIER().getText(),))
+                if callee:
+                    self._calls[self._current_function].add(callee)
 
         if isinstance(ctx, ZincParser.SpawnStatementContext):
             path = extract_identifier_path(ctx.expression())
             if path:
-                func_symbol = self.module_graph.resolve_function_path(self._current_module, path)
-                if func_symbol and func_symbol.name not in self.BUILTIN_FUNCTIONS:
-                    self._calls[self._current_function].add(func_symbol.qualified_name)
+                callee = self._call_target(path)
+                if callee:
+                    self._calls[self._current_function].add(callee)
             if isinstance(ctx.expression(), ZincParser.MemberAccessExprContext):
-                member_name = ctx.expression().IDENTIFIER().getText()
-                func_symbol = self.module_graph.resolve_function_path(self._current_module, [member_name])
-                if func_symbol and func_symbol.name not in self.BUILTIN_FUNCTIONS:
-                    self._calls[self._current_function].add(func_symbol.qualified_name)
+                callee = self._call_target((ctx.expression().IDENTIFIER().getText(),))
+                if callee:
+                    self._calls[self._current_function].add(callee)
 
         if isinstance(ctx, ZincParser.StructInstantiationContext):
             struct_symbol = self.module_graph.resolve_struct_path(self._current_module, struct_path_from_ctx(ctx))
@@ -712,10 +774,17 @@ class AtlasBuilder:
                 if struct_symbol:
                     self._add_struct_usage(struct_symbol.qualified_name, None)
 
-        for i in range(ctx.getChildCount()):
-            child = ctx.getChild(i)
-            if isinstance(child, ParserRuleContext):
-                self._walk_for_references(child)
+    def _call_target(self, path: Sequence[str]) -> str | None:
+        """Resolve a call path in the current module to a non-builtin function name, once per distinct path."""
+        key = (self._current_module, tuple(path))
+        try:
+            return self._call_targets[key]
+        except KeyError:
+            pass
+        func_symbol = self.module_graph.resolve_function_path(self._current_module, list(path))
+        callee = func_symbol.qualified_name if func_symbol and func_symbol.name not in self.BUILTIN_FUNCTIONS else None
+        self._call_targets[key] = callee
+        return callee
 
     def _add_struct_usage(self, qualified_name: str, method_name: str | None) -> None:
         """Record that a struct is used, optionally with a specific method."""
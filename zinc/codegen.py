@@ -44,7 +44,13 @@ from zinc.numeric_literals import is_numeric_literal, numeric_literal_value
 from zinc.operators import ResolvedOperatorCall
 from zinc.parser.zincParser import zincParser as ZincParser
 from zinc.parser.zincVisitor import zincVisitor
-from zinc.string_literals import is_interpolated_string_literal, is_string_literal, to_rust_string_literal
+from zinc.string_literals import (
+    INTERPOLATION_NAME_PATTERN,
+    is_interpolated_string_literal,
+    is_string_literal,
+    split_interpolations,
+    to_rust_string_literal,
+)
 from zinc.symbols import (
     BoundArgument,
     BoundStructField,
@@ -52,7 +58,10 @@ from zinc.symbols import (
     SymbolKind,
     SymbolTable,
     arrow_lambda_body_expression,
+    binary_operator,
+    dispatch_visit,
     function_parameters,
+    visit_children,
 )
 
 BITWISE_VALUE_ASSIGNMENT_OPERATORS = frozenset({"&=", "|=", "^="})
@@ -117,10 +126,8 @@ class RustProgram:
         else:
             parts.append("fn main() {")
 
-        for stmt in self.main_body:
-            # Handle multiline statements by indenting each line
-            for line in stmt.split("\n"):
-                parts.append(f"    {line}")
+        # Handle multiline statements by indenting every line of each statement
+        parts.extend("    " + stmt.replace("\n", "\n    ") for stmt in self.main_body)
         parts.append("}")
 
         return "\n".join(parts)
@@ -154,6 +161,7 @@ class CodeGenVisitor(zincVisitor):
         self._callable_call_specialization_map = callable_call_specialization_map or {}
         self._ufcs_extern_call_map = ufcs_extern_call_map or {}
         self._operator_calls = operator_calls or {}
+        self._call_sites_by_target: dict[str, list[tuple[str | None, tuple[int, int]]]] | None = None
         self._uses_async = False
         self._current_function: str | None = None
         self._current_module: str | None = None
@@ -177,6 +185,8 @@ class CodeGenVisitor(zincVisitor):
         self._current_channel_params: set[str] = set()
         self._boxed_struct_vars: set[tuple[str | None, str]] = set()
         self._callable_signatures: dict[str, CallableTypeInfo] = {}
+        # rust_type_name -> (targets tuple the index was built from, storage_key -> variant index)
+        self._callable_variant_indexes: dict[str, tuple[tuple[CallableTarget, ...], dict[tuple, int]]] = {}
         self._anonymous_structs: dict[tuple, AnonymousStructTypeInfo] = {}
         self._captured_binding_names: set[str] = set()
         self._runtime_symbols: set[str] = set()
@@ -185,16 +195,19 @@ class CodeGenVisitor(zincVisitor):
 
     def visit(self, tree):
         """Visit one parse node and post-process try-propagation sites."""
-        rendered = super().visit(tree)
-        if not isinstance(tree, ParserRuleContext) or not isinstance(rendered, str):
-            return rendered
-        if not isinstance(tree, ZincParser.ExpressionContext):
+        rendered = dispatch_visit(self, tree)
+        # Only rendered expressions can carry try-propagation; ExpressionContext implies a rule context.
+        if rendered.__class__ is not str or not isinstance(tree, ZincParser.ExpressionContext):
             return rendered
         family = self.symbols.auto_unwrap_family(tree.getSourceInterval(), self._current_function)
         if family in {BaseType.RESULT, BaseType.OPTION}:
             return f"({rendered})?"
         return rendered
 
+    def visitChildren(self, node):
+        """Visit child nodes without going through each child's accept()."""
+        return visit_children(self, node)
+
     def _require_runtime_symbol(self, rust_name: str) -> None:
         """Record a Zinc runtime symbol that generated Rust references."""
         feature = RUNTIME_SYMBOL_FEATURES[rust_name]
@@ -203,25 +216,16 @@ class CodeGenVisitor(zincVisitor):
 
     def _require_runtime_for_builtin_types(self) -> None:
         """Record runtime symbols required by resolved Zinc channel/context types."""
-        for symbol in self.symbols.all_symbols():
-            if symbol.kind not in {SymbolKind.VARIABLE, SymbolKind.PARAMETER}:
-                continue
-            if symbol.resolved_type == BaseType.CHANNEL:
-                self._require_runtime_symbol("Channel")
-            elif symbol.resolved_type == BaseType.CONTEXT:
-                self._require_runtime_symbol("Context")
+        used_types = {
+            symbol.resolved_type for symbol in self.symbols.all_symbols() if symbol.kind in {SymbolKind.VARIABLE, SymbolKind.PARAMETER}
+        }
         for func in self.atlas.functions.values():
-            for arg_type in func.arg_types:
-                if arg_type == BaseType.CHANNEL:
-                    self._require_runtime_symbol("Channel")
-                elif arg_type == BaseType.CONTEXT:
-                    self._require_runtime_symbol("Context")
-            if func.return_type == BaseType.CHANNEL:
-                self._require_runtime_symbol("Channel")
-            elif func.return_type == BaseType.CONTEXT:
-                self._require_runtime_symbol("Context")
-        if self._channel_infos:
+            used_types.update(func.arg_types)
+            used_types.add(func.return_type)
+        if BaseType.CHANNEL in used_types or self._channel_infos:
             self._require_runtime_symbol("Channel")
+        if BaseType.CONTEXT in used_types:
+            self._require_runtime_symbol("Context")
 
     def generate(self) -> RustProgram:
         """Main entry point - generate Rust code for all reachable code."""
@@ -457,18 +461,22 @@ class CodeGenVisitor(zincVisitor):
             return func
         return None
 
+    def _call_sites_targeting(self, mangled_name: str) -> list[tuple[str | None, tuple[int, int]]]:
+        """Return (caller, interval) keys of call sites that dispatch to one specialization."""
+        if self._call_sites_by_target is None:
+            by_target: dict[str, list[tuple[str | None, tuple[int, int]]]] = {}
+            for key, target_name in self._specialization_map.items():
+                by_target.setdefault(target_name, []).append(key)
+            for key, target_names in self._callable_call_specialization_map.items():
+                for target_name in target_names:
+                    by_target.setdefault(target_name, []).append(key)
+            self._call_sites_by_target = by_target
+        return self._call_sites_by_target.get(mangled_name, [])
+
     def _concrete_callable_return_from_call_sites(self, mangled_name: str) -> CallableTypeInfo | None:
         """Find a concrete callable return signature for one function from its call sites."""
         resolved: CallableTypeInfo | None = None
-        call_sites: list[tuple[tuple[str | None, tuple[int, int]], str]] = [
-            (key, target_name) for key, target_name in self._specialization_map.items()
-        ]
-        for key, target_names in self._callable_call_specialization_map.items():
-            call_sites.extend((key, target_name) for target_name in target_names)
-
-        for (caller_name, interval), target_name in call_sites:
-            if target_name != mangled_name:
-                continue
+        for caller_name, interval in self._call_sites_targeting(mangled_name):
             symbol = self.symbols.lookup_by_interval(interval, caller_name)
             if symbol is None or not self._callable_info_is_concrete(symbol.callable_info):
                 continue
@@ -492,6 +500,8 @@ class CodeGenVisitor(zincVisitor):
                 self._check_for_mut_method_call(arrow_body)
                 self._walk_expression_if_blocks(arrow_body, self._prescan_block)
             elif hasattr(func.ctx, "block") and func.ctx.block() is not None:
+                # One escape walk covers every nested statement; _prescan_block only tracks assignments and calls.
+                self._prescan_callable_escapes(func.ctx.block())
                 self._prescan_block(func.ctx.block())
         self._current_module = previous_module
         self._current_function = previous_function
@@ -507,76 +517,66 @@ class CodeGenVisitor(zincVisitor):
 
     def _prescan_statement(self, stmt_ctx) -> None:
         """Scan a statement for struct tracking and literal variable tracking."""
+        # A statement wraps exactly one alternative; classify it once and reuse it below.
+        inner = stmt_ctx.getChild(0)
         # Track variable assignments of struct instances and literal values
-        if stmt_ctx.typedVariableAssignment():
-            var_ctx = stmt_ctx.typedVariableAssignment()
-            var_names = [token.getText() for token in self._typed_assignment_tokens(var_ctx.typedAssignmentTarget())]
-            expr = var_ctx.expression()
+        if isinstance(inner, ZincParser.TypedVariableAssignmentContext):
+            var_names = [token.getText() for token in self._typed_assignment_tokens(inner.typedAssignmentTarget())]
+            expr = inner.expression()
             struct_name = self._detect_struct_assignment(expr)
             if struct_name:
                 for var_name in var_names:
                     self._struct_instance_vars[f"{self._current_function}:{var_name}"] = struct_name
             elif self._is_compile_time_literal_expr(expr):
                 self._literal_vars.update(var_names)
-        if stmt_ctx.variableAssignment():
-            var_ctx = stmt_ctx.variableAssignment()
-            target = var_ctx.assignmentTarget()
+        elif isinstance(inner, ZincParser.VariableAssignmentContext):
+            target = inner.assignmentTarget()
             if target.IDENTIFIER():
                 var_name = target.IDENTIFIER().getText()
-                expr = var_ctx.expression()
+                expr = inner.expression()
                 struct_name = self._detect_struct_assignment(expr)
                 if struct_name:
                     self._struct_instance_vars[f"{self._current_function}:{var_name}"] = struct_name
                 # Track if variable is assigned a compile-time literal value
                 elif self._is_compile_time_literal_expr(expr):
                     self._literal_vars.add(var_name)
-
-        self._prescan_callable_escapes(stmt_ctx)
-
         # Track method calls that require mut
-        if stmt_ctx.expressionStatement():
-            expr = stmt_ctx.expressionStatement().expression()
-            self._check_for_mut_method_call(expr)
+        elif isinstance(inner, ZincParser.ExpressionStatementContext):
+            self._check_for_mut_method_call(inner.expression())
+
         for expr_ctx in self._statement_expressions(stmt_ctx):
             self._walk_expression_if_blocks(expr_ctx, self._prescan_block)
 
         # Recurse into blocks
-        if stmt_ctx.ifStatement():
-            for block in stmt_ctx.ifStatement().block():
+        if isinstance(inner, ZincParser.IfStatementContext):
+            for block in inner.block():
                 self._prescan_block(block)
-        if stmt_ctx.forStatement():
-            self._prescan_block(stmt_ctx.forStatement().block())
-        if stmt_ctx.whileStatement():
-            self._prescan_block(stmt_ctx.whileStatement().block())
-        if stmt_ctx.loopStatement():
-            self._prescan_block(stmt_ctx.loopStatement().block())
+        elif isinstance(inner, (ZincParser.ForStatementContext, ZincParser.WhileStatementContext, ZincParser.LoopStatementContext)):
+            self._prescan_block(inner.block())
 
     def _statement_expressions(self, stmt_ctx) -> list[ParserRuleContext]:
         """Collect the direct expression children of a statement."""
-        expressions: list[ParserRuleContext] = []
-        if stmt_ctx.typedVariableAssignment():
-            expressions.append(stmt_ctx.typedVariableAssignment().expression())
-        if stmt_ctx.variableAssignment():
-            expressions.append(stmt_ctx.variableAssignment().expression())
-        if stmt_ctx.outAssignment():
-            expressions.append(stmt_ctx.outAssignment().expression())
-        if stmt_ctx.expressionStatement():
-            expressions.append(stmt_ctx.expressionStatement().expression())
-        if stmt_ctx.returnStatement() and stmt_ctx.returnStatement().expression():
-            expressions.append(stmt_ctx.returnStatement().expression())
-        if stmt_ctx.channelSendStatement():
-            expressions.append(stmt_ctx.channelSendStatement().expression())
-        if stmt_ctx.ifStatement():
-            expressions.extend(stmt_ctx.ifStatement().expression())
-        if stmt_ctx.forStatement():
-            expressions.append(stmt_ctx.forStatement().expression())
-        if stmt_ctx.whileStatement():
-            expressions.append(stmt_ctx.whileStatement().expression())
-        if stmt_ctx.spawnStatement():
-            expressions.append(stmt_ctx.spawnStatement().expression())
-            if stmt_ctx.spawnStatement().argumentList():
-                expressions.extend(self._raw_call_exprs(stmt_ctx.spawnStatement().argumentList()))
-        return expressions
+        inner = stmt_ctx.getChild(0)
+        if isinstance(
+            inner,
+            (
+                ZincParser.TypedVariableAssignmentContext,
+                ZincParser.VariableAssignmentContext,
+                ZincParser.OutAssignmentContext,
+                ZincParser.ExpressionStatementContext,
+                ZincParser.ChannelSendStatementContext,
+                ZincParser.ForStatementContext,
+                ZincParser.WhileStatementContext,
+            ),
+        ):
+            return [inner.expression()]
+        if isinstance(inner, ZincParser.ReturnStatementContext):
+            return [inner.expression()] if inner.expression() else []
+        if isinstance(inner, ZincParser.IfStatementContext):
+            return list(inner.expression())
+        if isinstance(inner, ZincParser.SpawnStatementContext):
+            return [inner.expression(), *self._raw_call_exprs(inner.argumentList())]
+        return []
 
     def _walk_expression_if_blocks(self, node, visit_block) -> None:
         """Visit each block nested inside expression-form if subtrees."""
@@ -795,9 +795,10 @@ class CodeGenVisitor(zincVisitor):
     def _append_block_lines(self, lines: list[str], stmts: list[str], indent: int) -> None:
         """Append rendered statements with a fixed indentation level."""
         prefix = "    " * indent
+        newline_prefix = f"\n{prefix}"
+        # Callers join lines with newlines, so indenting each statement in one pass matches per-line appends.
         for stmt in stmts:
-            for line in stmt.split("\n"):
-                lines.append(f"{prefix}{line}")
+            lines.append(prefix + stmt.replace("\n", newline_prefix))
 
     def _append_rendered_statement(self, stmts: list[str], rendered) -> None:
         """Append a rendered statement or statement list to a block."""
@@ -1393,12 +1394,9 @@ class CodeGenVisitor(zincVisitor):
 
         keep: dict[str, CallableTypeInfo] = {}
         for infos in grouped.values():
-            has_concrete = any(
-                all(base_type != BaseType.UNKNOWN for base_type in info.param_types) and info.return_type != BaseType.UNKNOWN
-                for info in infos
-            )
-            for info in infos:
-                is_abstract = any(base_type == BaseType.UNKNOWN for base_type in info.param_types) or info.return_type == BaseType.UNKNOWN
+            abstract_flags = [info.return_type == BaseType.UNKNOWN or BaseType.UNKNOWN in info.param_types for info in infos]
+            has_concrete = not all(abstract_flags)
+            for info, is_abstract in zip(infos, abstract_flags):
                 if is_abstract and has_concrete:
                     continue
                 keep[info.rust_type_name()] = info
@@ -1406,11 +1404,18 @@ class CodeGenVisitor(zincVisitor):
 
     def _callable_variant_name(self, info: CallableTypeInfo, target: CallableTarget) -> str:
         """Return the stable enum variant name for a callable target."""
-        registry_info = self._callable_signatures.get(info.rust_type_name(), info)
-        ordered = sorted(registry_info.targets, key=lambda item: item.storage_key())
-        for index, candidate in enumerate(ordered):
-            if candidate.storage_key() == target.storage_key():
-                return f"V{index}"
+        type_name = info.rust_type_name()
+        registry_info = self._callable_signatures.get(type_name, info)
+        cached = self._callable_variant_indexes.get(type_name)
+        if cached is None or cached[0] is not registry_info.targets:
+            indexes: dict[tuple, int] = {}
+            for index, key in enumerate(sorted(candidate.storage_key() for candidate in registry_info.targets)):
+                indexes.setdefault(key, index)
+            cached = (registry_info.targets, indexes)
+            self._callable_variant_indexes[type_name] = cached
+        index = cached[1].get(target.storage_key())
+        if index is not None:
+            return f"V{index}"
         raise KeyError(f"unknown callable target: {target.display_name}")
 
     def _type_with_metadata_to_rust(
@@ -2084,9 +2089,7 @@ class CodeGenVisitor(zincVisitor):
             lines.append("")
             lines.append(f"impl {rust_name} {{")
             for method in struct.methods:
-                method_code = self._generate_struct_method(method, struct)
-                for line in method_code.split("\n"):
-                    lines.append(f"    {line}")
+                self._append_block_lines(lines, [self._generate_struct_method(method, struct)], 1)
             lines.append("}")
 
         return "\n".join(lines)
@@ -2120,9 +2123,7 @@ class CodeGenVisitor(zincVisitor):
             lines.append("")
             lines.append(f"impl {self._enum_rust_name(enum)} {{")
             for method in enum.methods:
-                method_code = self._generate_enum_method(method, enum)
-                for line in method_code.split("\n"):
-                    lines.append(f"    {line}")
+                self._append_block_lines(lines, [self._generate_enum_method(method, enum)], 1)
             lines.append("}")
 
         return "\n".join(lines)
@@ -2167,9 +2168,7 @@ class CodeGenVisitor(zincVisitor):
         self._declared_vars = previous_declared
 
         lines = [f"fn {method.name}({params}){ret_type} {{"]
-        for stmt in body_stmts:
-            for line in stmt.split("\n"):
-                lines.append(f"    {line}")
+        self._append_block_lines(lines, body_stmts, 1)
         lines.append("}")
 
         return "\n".join(lines)
@@ -2205,9 +2204,7 @@ class CodeGenVisitor(zincVisitor):
         self._declared_vars = previous_declared
 
         lines = [f"fn {method.name}({params}){ret_type} {{"]
-        for stmt in body_stmts:
-            for line in stmt.split("\n"):
-                lines.append(f"    {line}")
+        self._append_block_lines(lines, body_stmts, 1)
         lines.append("}")
         return "\n".join(lines)
 
@@ -2378,10 +2375,7 @@ class CodeGenVisitor(zincVisitor):
 
         async_kw = "async " if (func.is_async if force_async is None else force_async) else ""
         lines = [f"{async_kw}fn {rust_name}({param_str}){return_type_str} {{"]
-        for stmt in body_stmts:
-            # Handle multiline statements (like for loops, if/else) by indenting each line
-            for line in stmt.split("\n"):
-                lines.append(f"    {line}")
+        self._append_block_lines(lines, body_stmts, 1)
         lines.append("}")
 
         return "\n".join(lines)
@@ -2548,9 +2542,9 @@ class CodeGenVisitor(zincVisitor):
             for expr_ctx in self._statement_expressions(stmt):
                 if self._expression_if_blocks_contain_spawn(expr_ctx):
                     return True
-            if stmt.ifStatement():
-                if any(self._block_contains_spawn(block) for block in stmt.ifStatement().block()):
-                    return True
+            if_ctx = stmt.ifStatement()
+            if if_ctx and any(self._block_contains_spawn(block) for block in if_ctx.block()):
+                return True
             if stmt.forStatement() and self._block_contains_spawn(stmt.forStatement().block()):
                 return True
             if stmt.whileStatement() and self._block_contains_spawn(stmt.whileStatement().block()):
@@ -2651,7 +2645,7 @@ class CodeGenVisitor(zincVisitor):
         """Return True when repeating a spread source cannot repeat side effects."""
         if isinstance(expr_ctx, ZincParser.PrimaryExprContext):
             primary = expr_ctx.primaryExpression()
-            return bool(primary and (primary.IDENTIFIER() or primary.getText() == "self"))
+            return bool(primary and (primary.IDENTIFIER() or primary.SELF() is not None))
         if isinstance(expr_ctx, ZincParser.MemberAccessExprContext):
             return self._simple_spread_source(expr_ctx.expression())
         return False
@@ -2791,10 +2785,9 @@ class CodeGenVisitor(zincVisitor):
     def _render_interpolated_string(self, text: str) -> str:
         """Convert string interpolation to format! macro."""
         inner = text[1:-1]
-        interpolations = re.findall(r"\{([^}]+)\}", inner)
+        format_str, interpolations = split_interpolations(inner)
         if not interpolations:
             return text
-        format_str = re.sub(r"\{[^}]+\}", "{}", inner)
         args = ", ".join(self._rewrite_interpolation_expr(expr) for expr in interpolations)
         return f'format!("{format_str}", {args})'
 
@@ -2852,21 +2845,21 @@ class CodeGenVisitor(zincVisitor):
 
             return token
 
-        return re.sub(r"\b[A-Za-z_][A-Za-z0-9_]*(?:\.[A-Za-z_][A-Za-z0-9_]*)*\b", replace, expr)
+        return INTERPOLATION_NAME_PATTERN.sub(replace, expr)
 
     def visitPrimaryExpression(self, ctx: ZincParser.PrimaryExpressionContext) -> str:
         """Visit a primary expression."""
-        if hasattr(ctx, "builtinTypeQuery") and ctx.builtinTypeQuery():
+        if ctx.builtinTypeQuery():
             constant_value = self._constant_value_for_expr(ctx)
             if constant_value is not None:
                 return self._render_constant_value(constant_value)
         if ctx.literal():
             return self.visit(ctx.literal())
-        if hasattr(ctx, "unitLiteral") and ctx.unitLiteral():
+        if ctx.unitLiteral():
             return "()"
-        if hasattr(ctx, "anonymousStructLiteral") and ctx.anonymousStructLiteral():
+        if ctx.anonymousStructLiteral():
             return self.visit(ctx.anonymousStructLiteral())
-        if hasattr(ctx, "builtinResultOptionConstructor") and ctx.builtinResultOptionConstructor():
+        if ctx.builtinResultOptionConstructor():
             ctor = ctx.builtinResultOptionConstructor()
             if ctor.NONE():
                 return "None"
@@ -2884,7 +2877,7 @@ class CodeGenVisitor(zincVisitor):
             target_spec = expr_symbol.option_info.some_type if expr_symbol and expr_symbol.option_info else None
             inner = self._coerce_to_value_spec(inner, target_spec, inner_expr)
             return f"Some({inner})"
-        name_token = ctx.IDENTIFIER() or (ctx.TYPE_KW() if hasattr(ctx, "TYPE_KW") else None)
+        name_token = ctx.IDENTIFIER() or ctx.TYPE_KW()
         if name_token:
             name = name_token.getText()
             expr_symbol = self._get_expr_symbol(ctx)
@@ -2915,7 +2908,7 @@ class CodeGenVisitor(zincVisitor):
             return self.visit(ctx.enumVariantConstruction())
         if ctx.structInstantiation():
             return self.visit(ctx.structInstantiation())
-        if ctx.getText() == "self":
+        if ctx.SELF() is not None:
             return "self"
         if ctx.expression():
             return f"({self.visit(ctx.expression())})"
@@ -2958,7 +2951,7 @@ class CodeGenVisitor(zincVisitor):
 
     def visitPrimaryExpr(self, ctx: ZincParser.PrimaryExprContext) -> str:
         """Visit primary expression wrapper."""
-        return self.visit(ctx.primaryExpression())
+        return self.visitPrimaryExpression(ctx.primaryExpression())
 
     def visitLambdaExpr(self, ctx: ZincParser.LambdaExprContext) -> str:
         """Visit a lambda expression wrapper."""
@@ -3025,34 +3018,34 @@ class CodeGenVisitor(zincVisitor):
             return f"({elements[0]},)"
         return f"({', '.join(elements)})"
 
-    def visitAdditiveExpr(self, ctx: ZincParser.AdditiveExprContext) -> str:
-        """Visit addition/subtraction expression."""
-        left = self.visit(ctx.expression(0))
-        op = ctx.getChild(1).getText()
-        right = self.visit(ctx.expression(1))
+    def _render_promoted_binary_expr(self, ctx) -> str:
+        """Render an arithmetic or comparison operator with mixed int/float operands promoted."""
+        left_ctx, right_ctx = ctx.expression()
+        left = self.visit(left_ctx)
+        op = binary_operator(ctx)
+        right = self.visit(right_ctx)
         call = self._operator_call_for_ctx(ctx)
         if call is not None:
             return self._render_resolved_operator_call(call, [left, right])
-        left, right = self._promote_numeric_operands(
-            left,
-            ctx.expression(0),
-            right,
-            ctx.expression(1),
-        )
-
+        left, right = self._promote_numeric_operands(left, left_ctx, right, right_ctx)
         return f"({left} {op} {right})"
 
+    def visitAdditiveExpr(self, ctx: ZincParser.AdditiveExprContext) -> str:
+        """Visit addition/subtraction expression."""
+        return self._render_promoted_binary_expr(ctx)
+
     def _render_bitwise_binary_expr(self, ctx) -> str:
         """Render integer bitwise AND, OR, and XOR."""
-        left = self.visit(ctx.expression(0))
-        op = ctx.getChild(1).getText()
-        right = self.visit(ctx.expression(1))
+        left_ctx, right_ctx = ctx.expression()
+        left = self.visit(left_ctx)
+        op = binary_operator(ctx)
+        right = self.visit(right_ctx)
         call = self._operator_call_for_ctx(ctx)
         if call is not None:
             return self._render_resolved_operator_call(call, [left, right])
         result_exact_type = self._get_expr_exact_type(ctx)
-        left = self._coerce_bitwise_operand(left, ctx.expression(0), result_exact_type)
-        right = self._coerce_bitwise_operand(right, ctx.expression(1), result_exact_type)
+        left = self._coerce_bitwise_operand(left, left_ctx, result_exact_type)
+        right = self._coerce_bitwise_operand(right, right_ctx, result_exact_type)
         return f"({left} {op} {right})"
 
     def visitBitwiseAndExpr(self, ctx: ZincParser.BitwiseAndExprContext) -> str:
@@ -3070,7 +3063,7 @@ class CodeGenVisitor(zincVisitor):
     def visitShiftExpr(self, ctx: ZincParser.ShiftExprContext) -> str:
         """Visit integer shift expression."""
         left = self.visit(ctx.expression(0))
-        op = ctx.getChild(1).getText()
+        op = binary_operator(ctx)
         right = self.visit(ctx.expression(1))
         call = self._operator_call_for_ctx(ctx)
         if call is not None:
@@ -3079,29 +3072,17 @@ class CodeGenVisitor(zincVisitor):
 
     def visitMultiplicativeExpr(self, ctx: ZincParser.MultiplicativeExprContext) -> str:
         """Visit multiplication/division expression."""
-        left = self.visit(ctx.expression(0))
-        op = ctx.getChild(1).getText()
-        right = self.visit(ctx.expression(1))
-        call = self._operator_call_for_ctx(ctx)
-        if call is not None:
-            return self._render_resolved_operator_call(call, [left, right])
-        left, right = self._promote_numeric_operands(
-            left,
-            ctx.expression(0),
-            right,
-            ctx.expression(1),
-        )
-
-        return f"({left} {op} {right})"
+        return self._render_promoted_binary_expr(ctx)
 
     def visitPowerExpr(self, ctx: ZincParser.PowerExprContext) -> str:
         """Visit exponentiation expression."""
-        left = self.visit(ctx.expression(0))
-        right = self.visit(ctx.expression(1))
+        left_ctx, right_ctx = ctx.expression()
+        left = self.visit(left_ctx)
+        right = self.visit(right_ctx)
         call = self._operator_call_for_ctx(ctx)
         if call is not None:
             return self._render_resolved_operator_call(call, [left, right])
-        return self._render_power_expr(left, ctx.expression(0), right, ctx.expression(1), ctx)
+        return self._render_power_expr(left, left_ctx, right, right_ctx, ctx)
 
     def _get_expr_type(self, ctx) -> BaseType:
         """Get the resolved type of an expression from the symbol table or atlas."""
@@ -3202,9 +3183,10 @@ class CodeGenVisitor(zincVisitor):
 
     def _lookup_local_symbol(self, name: str):
         """Look up the latest resolved local/parameter symbol in the current function."""
-        prefix = f"{self._current_function}."
-        matches = [symbol for symbol in self.symbols.all_symbols() if symbol.id == name and symbol.unique_name.startswith(prefix)]
-        return matches[-1] if matches else None
+        for symbol in reversed(self.symbols.function_symbols(self._current_function)):
+            if symbol.id == name:
+                return symbol
+        return None
 
     def _lookup_identifier_symbol(self, name: str):
         """Resolve an identifier name to the nearest local symbol, if any."""
@@ -3220,13 +3202,10 @@ class CodeGenVisitor(zincVisitor):
 
     def _lookup_captured_ref_symbol(self, name: str):
         """Return the closure-local captured-ref symbol for a given source name."""
-        prefix = f"{self._current_function}."
-        matches = [
-            symbol
-            for symbol in self.symbols.all_symbols()
-            if symbol.id == name and symbol.unique_name.startswith(prefix) and symbol.is_captured_ref
-        ]
-        return matches[-1] if matches else None
+        for symbol in reversed(self.symbols.function_symbols(self._current_function)):
+            if symbol.id == name and symbol.is_captured_ref:
+                return symbol
+        return None
 
     def _fallback_symbol_for_ctx(self, ctx):
         """Prefer the latest local binding when the interval symbol is a stale temporary."""
@@ -3410,46 +3389,21 @@ class CodeGenVisitor(zincVisitor):
 
     def visitRelationalExpr(self, ctx: ZincParser.RelationalExprContext) -> str:
         """Visit relational comparison."""
-        left = self.visit(ctx.expression(0))
-        op = ctx.getChild(1).getText()
-        right = self.visit(ctx.expression(1))
-        call = self._operator_call_for_ctx(ctx)
-        if call is not None:
-            return self._render_resolved_operator_call(call, [left, right])
-        left, right = self._promote_numeric_operands(
-            left,
-            ctx.expression(0),
-            right,
-            ctx.expression(1),
-        )
-
-        return f"({left} {op} {right})"
+        return self._render_promoted_binary_expr(ctx)
 
     def visitEqualityExpr(self, ctx: ZincParser.EqualityExprContext) -> str:
         """Visit equality comparison."""
-        left = self.visit(ctx.expression(0))
-        op = ctx.getChild(1).getText()
-        right = self.visit(ctx.expression(1))
-        call = self._operator_call_for_ctx(ctx)
-        if call is not None:
-            return self._render_resolved_operator_call(call, [left, right])
-        left, right = self._promote_numeric_operands(
-            left,
-            ctx.expression(0),
-            right,
-            ctx.expression(1),
-        )
-
-        return f"({left} {op} {right})"
+        return self._render_promoted_binary_expr(ctx)
 
     def visitMembershipExpr(self, ctx: ZincParser.MembershipExprContext) -> str:
         """Visit membership comparison."""
-        left = self.visit(ctx.expression(0))
-        right = self.visit(ctx.expression(1))
+        left_ctx, right_ctx = ctx.expression()
+        left = self.visit(left_ctx)
+        right = self.visit(right_ctx)
         call = self._operator_call_for_ctx(ctx)
         if call is not None:
             return self._render_resolved_operator_call(call, [left, right])
-        right_type = self._get_expr_type(ctx.expression(1))
+        right_type = self._get_expr_type(right_ctx)
         if right_type == BaseType.SET:
             return f"({right}.contains(&{left}))"
         if right_type == BaseType.DICT:
@@ -3591,7 +3545,7 @@ class CodeGenVisitor(zincVisitor):
         call = self._operator_call_for_ctx(ctx)
         if call is not None:
             return self._render_resolved_operator_call(call, [start, end])
-        if ctx.getChild(1).getText() == "..=":
+        if binary_operator(ctx) == "..=":
             return f"{start}..={end}"
         return f"{start}..{end}"
 
@@ -3657,11 +3611,12 @@ class CodeGenVisitor(zincVisitor):
                         return self._enum_rust_name(enum)
                     return self.module_graph.rust_base_name(enum_symbol.qualified_name)
 
-        if isinstance(ctx.expression(), ZincParser.PrimaryExprContext):
-            primary = ctx.expression().primaryExpression()
+        receiver_ctx = ctx.expression()
+        if isinstance(receiver_ctx, ZincParser.PrimaryExprContext):
+            primary = receiver_ctx.primaryExpression()
             if primary and primary.IDENTIFIER():
                 receiver_name = primary.IDENTIFIER().getText()
-                receiver_symbol = self._get_expr_symbol(ctx.expression())
+                receiver_symbol = self._get_expr_symbol(receiver_ctx)
                 if receiver_symbol and self._symbol_is_captured_cell(receiver_symbol):
                     storage_name = self._symbol_storage_unique_name(receiver_symbol)
                     if storage_name is not None:
@@ -3693,7 +3648,7 @@ class CodeGenVisitor(zincVisitor):
                         return f"{field_expr}.clone()"
                     return field_expr
         # Regular member access (field or instance method)
-        obj = self.visit(ctx.expression())
+        obj = self.visit(receiver_ctx)
         return f"{obj}.{ctx.IDENTIFIER().getText()}"
 
     def visitFunctionCallExpr(self, ctx: ZincParser.FunctionCallExprContext) -> str:
@@ -4325,9 +4280,8 @@ class CodeGenVisitor(zincVisitor):
             return f"println!({inner})"
         if arg.startswith('"'):
             inner = arg[1:-1]
-            interpolations = re.findall(r"\{([^}]+)\}", inner)
+            format_str, interpolations = split_interpolations(inner)
             if interpolations:
-                format_str = re.sub(r"\{[^}]+\}", "{}", inner)
                 expr_args = ", ".join(self._rewrite_interpolation_expr(expr) for expr in interpolations)
                 return f'println!("{format_str}", {expr_args})'
             return f'println!("{inner}")'
@@ -4713,10 +4667,11 @@ class CodeGenVisitor(zincVisitor):
     def visitTypedVariableAssignment(self, ctx: ZincParser.TypedVariableAssignmentContext) -> str:
         """Visit a typed local declaration."""
         target_ctx = ctx.typedAssignmentTarget()
+        expr_ctx = ctx.expression()
         if target_ctx.tupleAssignmentTarget():
-            value = self._visit_expression_with_expectations(ctx.expression(), coerce_scalar=False)
-            expr_type = self._get_expr_type(ctx.expression())
-            tuple_info = self._get_tuple_info(ctx.expression())
+            value = self._visit_expression_with_expectations(expr_ctx, coerce_scalar=False)
+            expr_type = self._get_expr_type(expr_ctx)
+            tuple_info = self._get_tuple_info(expr_ctx)
             if expr_type == BaseType.TUPLE and tuple_info is not None:
                 tokens = self._typed_assignment_tokens(target_ctx)
                 target_symbols = [self._symbol_for_binding_token(token) for token in tokens]
@@ -4734,13 +4689,13 @@ class CodeGenVisitor(zincVisitor):
                         item_value = f"({item_value} as {exact_type_to_rust(symbol.exact_type, BaseType.FLOAT)})"
                     lines.append(self._render_identifier_assignment(name, symbol, item_value, include_type=True))
                 return "\n".join(lines)
-            return self._render_broadcast_assignment(ctx, target_ctx.tupleAssignmentTarget(), ctx.expression(), value, include_type=True)
+            return self._render_broadcast_assignment(ctx, target_ctx.tupleAssignmentTarget(), expr_ctx, value, include_type=True)
 
         token = target_ctx.IDENTIFIER()
         var_name = token.getText()
         symbol = self.symbols.lookup_by_interval(token.getSourceInterval(), self._current_function)
         value = self._visit_expression_with_expectations(
-            ctx.expression(),
+            expr_ctx,
             expected_type=symbol.resolved_type if symbol else None,
             dict_info=symbol.dict_info if symbol else None,
             set_info=symbol.set_info if symbol else None,
@@ -4749,7 +4704,7 @@ class CodeGenVisitor(zincVisitor):
             coerce_scalar=False,
         )
         if symbol is not None:
-            value = self._coerce_numeric_rhs_for_target(value, ctx.expression(), symbol.resolved_type, symbol.exact_type)
+            value = self._coerce_numeric_rhs_for_target(value, expr_ctx, symbol.resolved_type, symbol.exact_type)
         if symbol is None:
             return f"let {var_name} = {value};"
 
@@ -5150,9 +5105,7 @@ class CodeGenVisitor(zincVisitor):
             ]
             for stmt in loop_prelude:
                 lines.append(f"        {stmt}")
-            for stmt in body_stmts:
-                for line in stmt.split("\n"):
-                    lines.append(f"        {line}")
+            self._append_block_lines(lines, body_stmts, 2)
             lines.append("    }")
             lines.append("}")
             return "\n".join(lines)
@@ -5162,10 +5115,7 @@ class CodeGenVisitor(zincVisitor):
         lines = [f"for {loop_header_pattern} in {iterable} {{"]
         for stmt in loop_prelude:
             lines.append(f"    {stmt}")
-        for stmt in body_stmts:
-            # Handle multi-line statements (like nested if/while)
-            for line in stmt.split("\n"):
-                lines.append(f"    {line}")
+        self._append_block_lines(lines, body_stmts, 1)
         lines.append("}")
         return "\n".join(lines)
 
@@ -5175,10 +5125,7 @@ class CodeGenVisitor(zincVisitor):
         body_stmts = self._generate_block(ctx.block())
 
         lines = [f"while {cond} {{"]
-        for stmt in body_stmts:
-            # Handle multi-line statements (like nested if/while)
-            for line in stmt.split("\n"):
-                lines.append(f"    {line}")
+        self._append_block_lines(lines, body_stmts, 1)
         lines.append("}")
         return "\n".join(lines)
 
@@ -5187,10 +5134,7 @@ class CodeGenVisitor(zincVisitor):
         body_stmts = self._generate_block(ctx.block())
 
         lines = ["loop {"]
-        for stmt in body_stmts:
-            # Handle multi-line statements (like nested if/while)
-            for line in stmt.split("\n"):
-                lines.append(f"    {line}")
+        self._append_block_lines(lines, body_stmts, 1)
         lines.append("}")
         return "\n".join(lines)
 
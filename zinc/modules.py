@@ -121,6 +121,8 @@ class ModuleGraph:
     top_level_symbols: dict[str, TopLevelSymbol]
     package_name: str
     package_version: str
+    # Flattened Rust base names per qualified name; every specialization and call site re-derives them.
+    _rust_base_names: dict[str, str] = field(default_factory=dict, init=False, repr=False, compare=False)
 
     @staticmethod
     def extern_type_qualified_name(module_id: str, name: str) -> str:
@@ -144,8 +146,12 @@ class ModuleGraph:
 
     def rust_base_name(self, qualified_name: str) -> str:
         """Return the flattened Rust base name for a top-level symbol."""
-        module_id, name = self.split_qualified_name(qualified_name)
-        return f"{self.module_token(module_id)}__{name}"
+        base_name = self._rust_base_names.get(qualified_name)
+        if base_name is None:
+            module_id, name = self.split_qualified_name(qualified_name)
+            base_name = f"{self.module_token(module_id)}__{name}"
+            self._rust_base_names[qualified_name] = base_name
+        return base_name
 
     def get_module(self, module_id: str) -> LoadedModule:
         """Look up a module by id."""
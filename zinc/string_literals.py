@@ -3,6 +3,10 @@
 from __future__ import annotations
 
 import ast
+import re
+
+INTERPOLATION_PATTERN = re.compile(r"\{([^}]+)\}")
+INTERPOLATION_NAME_PATTERN = re.compile(r"\b[A-Za-z_][A-Za-z0-9_]*(?:\.[A-Za-z_][A-Za-z0-9_]*)*\b")
 
 
 def is_raw_string_literal(text: str) -> bool:
@@ -25,6 +29,20 @@ def is_interpolated_string_literal(text: str) -> bool:
     return len(text) >= 2 and text[0] == text[-1] == '"' and "{" in text
 
 
+def split_interpolations(text: str) -> tuple[str, list[str]]:
+    """Replace `{expr}` interpolations with `{}` and return the format string and the expressions.
+
+    Extraction and substitution share one regex pass over the text.
+    """
+    expressions: list[str] = []
+
+    def take(match: re.Match[str]) -> str:
+        expressions.append(match.group(1))
+        return "{}"
+
+    return INTERPOLATION_PATTERN.sub(take, text), expressions
+
+
 def decode_string_literal(text: str) -> str:
     """Decode a Zinc string literal into its runtime contents."""
     if is_raw_string_literal(text):
@@ -1,6 +1,9 @@
 """Symbol Table for the Zinc compiler."""
 
+import operator
 import re
+import sys
+from collections.abc import Callable
 from dataclasses import dataclass, replace
 from enum import Enum, auto
 
@@ -109,7 +112,7 @@ class SymbolKind(Enum):
     LITERAL = auto()  # Literal value
 
 
-@dataclass
+@dataclass(slots=True)
 class Symbol:
     """A symbol in the symbol table."""
 
@@ -145,7 +148,7 @@ class Symbol:
     line_num: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class CaptureBindingInfo:
     """Metadata for one captured outer binding."""
 
@@ -170,7 +173,7 @@ class CaptureBindingInfo:
     element_anonymous_struct_info: AnonymousStructTypeInfo | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class LexicalFunctionInfo:
     """A nested function or lambda defined within another function specialization."""
 
@@ -190,7 +193,7 @@ class LexicalFunctionInfo:
             self.captures = []
 
 
-@dataclass
+@dataclass(slots=True)
 class ResolvedValueInfo:
     """Resolved type plus rich metadata for a value-producing expression."""
 
@@ -208,7 +211,7 @@ class ResolvedValueInfo:
     option_info: OptionTypeInfo | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class RawCallArgument:
     """One syntactic call argument before binding to parameters."""
 
@@ -218,7 +221,7 @@ class RawCallArgument:
     is_spread: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class ParameterSpec:
     """One callable parameter slot used for named/default binding."""
 
@@ -228,7 +231,7 @@ class ParameterSpec:
     owner_module_id: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class BoundArgument:
     """One canonical call argument after binding to declaration order."""
 
@@ -243,7 +246,7 @@ class BoundArgument:
     spread_field_name: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class BoundStructField:
     """One final struct-literal field after spread/field last-wins binding."""
 
@@ -254,7 +257,7 @@ class BoundStructField:
     spread_field_name: str | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FunctionParameterInfo:
     """Normalized parameter metadata for declarations and arrow lambdas."""
 
@@ -277,37 +280,86 @@ def arrow_lambda_body_expression(ctx):
     return ctx.expression()
 
 
-def function_parameters(ctx) -> list[FunctionParameterInfo]:
+# Compile-time folds for comparison operators, keyed by operator token text.
+_COMPARISON_FOLDS: dict[str, Callable[[object, object], bool]] = {
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+    "==": operator.eq,
+    "!=": operator.ne,
+}
+
+
+def binary_operator(ctx) -> str:
+    """Return the operator of a binary expression node.
+
+    Every binary alternative is ``expression <op-token> expression``, so the operator
+    is read straight off the middle terminal instead of through getChild()/getText().
+    """
+    return ctx.children[1].symbol.text
+
+
+def function_parameters(ctx) -> tuple[FunctionParameterInfo, ...]:
     """Return normalized parameters for function-like parse nodes."""
-    params: list[FunctionParameterInfo] = []
     parameter_list = ctx.parameterList() if hasattr(ctx, "parameterList") else None
     if parameter_list is not None:
-        for param_ctx in parameter_list.parameter():
-            params.append(
-                FunctionParameterInfo(
-                    name=param_ctx.IDENTIFIER().getText(),
-                    ctx=param_ctx,
-                    default_expr=param_ctx.expression(),
-                    interval=param_ctx.getSourceInterval(),
-                    line_num=param_ctx.start.line if param_ctx.start is not None else 0,
-                )
+        return tuple(
+            FunctionParameterInfo(
+                name=param_ctx.IDENTIFIER().getText(),
+                ctx=param_ctx,
+                default_expr=param_ctx.expression(),
+                interval=param_ctx.getSourceInterval(),
+                line_num=param_ctx.start.line if param_ctx.start is not None else 0,
             )
-        return params
+            for param_ctx in parameter_list.parameter()
+        )
 
     if is_arrow_lambda_context(ctx) and ctx.IDENTIFIER() is not None:
         token = ctx.IDENTIFIER()
         symbol = token.getSymbol()
-        return [
+        return (
             FunctionParameterInfo(
                 name=token.getText(),
                 ctx=None,
                 default_expr=None,
                 interval=token.getSourceInterval(),
                 line_num=symbol.line if symbol is not None else 0,
-            )
-        ]
+            ),
+        )
+
+    return ()
+
+
+# visitor class -> (context class -> unbound visitXxx method, or None to fall back to ctx.accept)
+_VISIT_HANDLERS: dict[type, dict[type, Callable | None]] = {}
+
 
-    return params
+def dispatch_visit(visitor, tree):
+    """Visit one parse node through a cached handler instead of ANTLR's accept/hasattr double dispatch."""
+    context_type = type(tree)
+    handlers = _VISIT_HANDLERS.get(type(visitor))
+    if handlers is None:
+        handlers = _VISIT_HANDLERS[type(visitor)] = {}
+    try:
+        handler = handlers[context_type]
+    except KeyError:
+        handler = None
+        # Only contexts with a generated accept() map to visit<Name>; others keep their default behavior.
+        if isinstance(tree, ParserRuleContext) and "accept" in context_type.__dict__:
+            handler = getattr(type(visitor), f"visit{context_type.__name__.removesuffix('Context')}", None)
+        handlers[context_type] = handler
+    if handler is None:
+        return tree.accept(visitor)
+    return handler(visitor, tree)
+
+
+def visit_children(visitor, node):
+    """Visit each child in order and return the last child's result, like ParseTreeVisitor.visitChildren."""
+    result = None
+    for child in node.children or ():
+        result = dispatch_visit(visitor, child)
+    return result
 
 
 class SymbolTable:
@@ -316,9 +368,11 @@ class SymbolTable:
     def __init__(self):
         """Initialize empty symbol, scope, and interval lookup state."""
         self._symbols: list[Symbol] = []
+        self._symbols_by_function: dict[str, list[Symbol]] = {}  # top-level function scope -> named Symbols
         self._by_interval: dict[str, Symbol] = {}  # "scope:(start, stop)" -> Symbol
         self._auto_unwrap_intervals: dict[str, BaseType] = {}  # "scope:(start, stop)" -> Result/Option family
         self._scope_stack: list[dict[str, Symbol]] = [{}]  # Stack of id -> Symbol
+        self._visible: dict[str, list[Symbol]] = {}  # id -> shadowing stack of Symbols across open scopes
         self._temp_counter: int = 0
         self._scope_path: list[str] = []  # e.g., ["main", "if_0"]
         self._function_scope: str = ""  # Top-level function scope for interval keys
@@ -347,7 +401,12 @@ class SymbolTable:
     def exit_scope(self) -> None:
         """Exit current scope."""
         self._scope_path.pop()
-        self._scope_stack.pop()
+        visible = self._visible
+        for id in self._scope_stack.pop():
+            shadowed = visible[id]
+            shadowed.pop()
+            if not shadowed:
+                del visible[id]
         # Clear function scope when exiting function level
         if len(self._scope_path) == 0:
             self._function_scope = ""
@@ -370,6 +429,8 @@ class SymbolTable:
         """Define a named symbol in current scope."""
         if kind != SymbolKind.BUILTIN and id in RESERVED_ERROR_NAMES:
             raise ZincTypeError(f"'{id}' is a reserved builtin name")
+        # Intern once here so the Symbol, the scope entry and the _visible key share one string
+        id = sys.intern(id)
         # Include type in unique_name for shadowing support
         type_suffix = exact_type_to_rust(exact_type, resolved_type)
         base_name = f"{self.current_scope}.{id}" if self._scope_path else id
@@ -391,9 +452,15 @@ class SymbolTable:
             line_num=line_num,
         )
         self._symbols.append(symbol)
+        self._symbols_by_function.setdefault(self._function_scope, []).append(symbol)
         self._by_interval[self._interval_key(interval)] = symbol
         # Always update scope - this handles shadowing within same scope
-        self._scope_stack[-1][id] = symbol
+        scope = self._scope_stack[-1]
+        if id in scope:
+            self._visible[id][-1] = symbol
+        else:
+            self._visible.setdefault(id, []).append(symbol)
+        scope[id] = symbol
         return symbol
 
     def define_temp(
@@ -424,10 +491,8 @@ class SymbolTable:
 
     def lookup_by_id(self, id: str) -> Symbol | None:
         """Look up symbol by name in current and enclosing scopes."""
-        for scope in reversed(self._scope_stack):
-            if id in scope:
-                return scope[id]
-        return None
+        shadowed = self._visible.get(id)
+        return shadowed[-1] if shadowed else None
 
     def lookup_by_interval(self, interval: tuple[int, int], function_scope: str | None = None) -> Symbol | None:
         """Look up symbol by source interval.
@@ -446,6 +511,10 @@ class SymbolTable:
         """Return all defined symbols."""
         return self._symbols.copy()
 
+    def function_symbols(self, function_scope: str) -> list[Symbol]:
+        """Return named symbols defined inside a function scope (including its nested blocks), in definition order."""
+        return list(self._symbols_by_function.get(function_scope, ()))
+
     def lookup_by_unique_name(self, unique_name: str) -> Symbol | None:
         """Look up the symbol with this scoped unique name."""
         for symbol in reversed(self._symbols):
@@ -469,6 +538,8 @@ class SymbolTable:
         function_scope: str | None = None,
     ) -> BaseType | None:
         """Return the try-propagation family recorded for one expression, if any."""
+        if not self._auto_unwrap_intervals:
+            return None
         scope = function_scope if function_scope is not None else self._function_scope
         return self._auto_unwrap_intervals.get(f"{scope}:({interval[0]}, {interval[1]})")
 
@@ -518,6 +589,36 @@ class SymbolTableVisitor(zincVisitor):
         self._loop_depth = 0
         self._try_context_stack: list[dict[str, object | None]] = []
         self.operator_calls: dict[tuple[str | None, tuple[int, int]], ResolvedOperatorCall] = {}
+        # (cache kind, parse node) -> derived value; specializations re-read the same declarations and call sites
+        self._parse_node_cache: dict[tuple[str, ParserRuleContext], object] = {}
+
+    def visit(self, tree):
+        """Visit one parse node."""
+        return dispatch_visit(self, tree)
+
+    def visitChildren(self, node):
+        """Visit child nodes without going through each child's accept()."""
+        return visit_children(self, node)
+
+    def _function_parameters(self, ctx) -> tuple[FunctionParameterInfo, ...]:
+        """Return function_parameters(ctx), memoized for this analysis session."""
+        key = ("function_parameters", ctx)
+        params = self._parse_node_cache.get(key)
+        if params is None:
+            params = self._parse_node_cache[key] = function_parameters(ctx)
+        return params
+
+    def _ctx_text(self, ctx) -> str:
+        """Return ctx.getText(), memoized for this analysis session.
+
+        getText() re-concatenates every token under the node; type annotations and
+        default expressions are re-read for every specialization of their function.
+        """
+        key = ("text", ctx)
+        text = self._parse_node_cache.get(key)
+        if text is None:
+            text = self._parse_node_cache[key] = ctx.getText()
+        return text
 
     def _resolve_const_symbol(self, path: list[str]) -> ConstInstance | None:
         """Resolve a const path in the current module."""
@@ -705,7 +806,7 @@ class SymbolTableVisitor(zincVisitor):
         """Return canonical alternative type names, expanding numeric sugar."""
         names: list[str] = []
         for type_ctx in self._type_alternative_ctxs(owner_ctx):
-            text = type_ctx.getText()
+            text = self._ctx_text(type_ctx)
             if text == "numeric":
                 names.extend(NUMERIC_TYPE_ALTERNATIVES)
             else:
@@ -715,7 +816,7 @@ class SymbolTableVisitor(zincVisitor):
     def _has_type_alternative_constraint(self, owner_ctx) -> bool:
         """Return True when a parameter or field annotation desugars to an in-list constraint."""
         ctxs = self._type_alternative_ctxs(owner_ctx)
-        return len(ctxs) > 1 or (len(ctxs) == 1 and ctxs[0].getText() == "numeric")
+        return len(ctxs) > 1 or (len(ctxs) == 1 and self._ctx_text(ctxs[0]) == "numeric")
 
     def _single_type_ctx(self, owner_ctx):
         """Return a single concrete type annotation, excluding alternative-list sugar."""
@@ -1070,7 +1171,7 @@ class SymbolTableVisitor(zincVisitor):
         """Clone method metadata when flattening composition."""
         return replace(
             method,
-            parameters=[(name, type_ann, resolved) for name, type_ann, resolved in method.parameters],
+            parameters=list(method.parameters),
             parameter_defaults=dict(method.parameter_defaults),
             parameter_default_texts=dict(method.parameter_default_texts),
         )
@@ -1171,7 +1272,7 @@ class SymbolTableVisitor(zincVisitor):
 
             # Field can have type annotation OR default value expression
             if type_ctx is not None:
-                type_ann = type_ctx.getText()
+                type_ann = self._ctx_text(type_ctx)
                 is_infer = type_ann == "infer"
                 if not is_infer:
                     (
@@ -1297,14 +1398,28 @@ class SymbolTableVisitor(zincVisitor):
             for index, param_ctx in enumerate(ctx.parameterList().parameter()):
                 param_name = param_ctx.IDENTIFIER().getText()
                 type_ctx = self._single_type_ctx(param_ctx)
-                param_type = type_ctx.getText() if type_ctx is not None else None
+                param_type = self._ctx_text(type_ctx) if type_ctx is not None else None
                 parameters.append((param_name, param_type, None))
                 if param_ctx.expression() is not None:
                     parameter_defaults[index] = param_ctx.expression()
                     parameter_default_texts[index] = param_ctx.expression().getText()
 
-        # Track self usage in method body
-        self_reads, self_writes = self._track_self_usage(ctx.block())
+        # Track self usage, parameter hints, and return expressions in one body walk
+        has_return_annotation = hasattr(ctx, "type_") and ctx.type_() is not None
+        self_reads, self_writes, inferred_params, inferred_return_type = self._scan_method_body(
+            ctx.block(),
+            parameters,
+            field_types,
+            infer_params=operator_symbol is None,
+            return_type_of=None
+            if has_return_annotation
+            else lambda expr_ctx: self._method_return_expr_type(
+                expr_ctx,
+                field_types,
+                source_module_id,
+                constructor_owner_qualified_name,
+            ),
+        )
 
         # Determine static vs instance
         is_static = not (self_reads or self_writes)
@@ -1328,20 +1443,10 @@ class SymbolTableVisitor(zincVisitor):
                 is_static=is_static,
             )
         else:
-            # Infer parameter types from usage
-            resolved_params = self._infer_method_params(ctx.block(), parameters, field_types)
-
-        # Infer return type
-        return_type = (
-            ctx.type_().getText()
-            if hasattr(ctx, "type_") and ctx.type_() is not None
-            else self._infer_return_type(
-                ctx.block(),
-                field_types,
-                source_module_id,
-                constructor_owner_qualified_name,
-            )
-        )
+            # Parameter types inferred from usage
+            resolved_params = inferred_params
+
+        return_type = ctx.type_().getText() if has_return_annotation else inferred_return_type
         if operator_symbol is not None:
             self._validate_operator_method_shape(
                 display_name,
@@ -1464,70 +1569,42 @@ class SymbolTableVisitor(zincVisitor):
             if not owner_param_found:
                 raise ZincTypeError(f"{display_name} must include a {self.module_graph.get_symbol(owner_qualified_name).name} operand")
 
-    def _track_self_usage(self, block_ctx) -> tuple[bool, bool]:
-        """Walk a block and track self reads and writes. Returns (reads, writes)."""
+    def _scan_method_body(
+        self,
+        block_ctx,
+        params: list[tuple[str, str | None, str | None]],
+        field_types: dict[str, str],
+        *,
+        infer_params: bool,
+        return_type_of: Callable[[ParserRuleContext], str | None] | None,
+    ) -> tuple[bool, bool, list[tuple[str, str | None, str | None]], str | None]:
+        """Walk a method body once for self usage, parameter hints, and the inferred return type.
+
+        Returns (self_reads, self_writes, resolved_params, return_type). The return type comes from
+        the first return expression (in source order, not nested in another return) that
+        `return_type_of` can type; later return statements are not evaluated.
+        """
         reads = False
         writes = False
-
-        def walk(node):
-            nonlocal reads, writes
-            if node is None:
-                return
-
-            # Check for self.field = ... (write) - must check before read
-            if isinstance(node, ZincParser.VariableAssignmentContext):
-                target = node.assignmentTarget()
-                # Check if target is a member access on self
-                if target.memberAccess():
-                    member = target.memberAccess()
-                    target_expr = member.expression()
-                    # Check if expression is 'self'
-                    if isinstance(target_expr, ZincParser.PrimaryExprContext):
-                        primary = target_expr.primaryExpression()
-                        if primary and primary.getText() == "self":
-                            writes = True
-
-            # Check for self.field access (read) via member access expression
-            if isinstance(node, ZincParser.MemberAccessExprContext):
-                target_expr = node.expression()
-                if isinstance(target_expr, ZincParser.PrimaryExprContext):
-                    primary = target_expr.primaryExpression()
-                    if primary and primary.getText() == "self":
-                        reads = True
-
-            # Check for self in string interpolations
-            if isinstance(node, ZincParser.LiteralContext):
-                if node.STRING():
-                    text = node.STRING().getText()
-                    if "{self." in text:
-                        reads = True
-
-            # Recurse into children
-            if hasattr(node, "getChildCount"):
-                for i in range(node.getChildCount()):
-                    child = node.getChild(i)
-                    if isinstance(child, ParserRuleContext):
-                        walk(child)
-
-        walk(block_ctx)
-        return reads, writes
-
-    def _infer_method_params(
-        self, block_ctx, params: list[tuple[str, str | None, str | None]], field_types: dict[str, str]
-    ) -> list[tuple[str, str | None, str | None]]:
-        """Infer parameter types from method body usage."""
         param_names = {p[0] for p in params}
         inferred: dict[str, str] = {}
+        return_type: str | None = None
+
+        def self_member_field(member_ctx) -> str | None:
+            """If the member access target is `self`, return the accessed field name."""
+            target_expr = member_ctx.expression()
+            if isinstance(target_expr, ZincParser.PrimaryExprContext):
+                primary = target_expr.primaryExpression()
+                if primary and primary.SELF() is not None:
+                    return member_ctx.IDENTIFIER().getText()
+            return None
 
         def get_self_field_type(expr_ctx) -> str | None:
             """If expression is self.field, return its type."""
             if isinstance(expr_ctx, ZincParser.MemberAccessExprContext):
-                target = expr_ctx.expression()
-                if isinstance(target, ZincParser.PrimaryExprContext):
-                    primary = target.primaryExpression()
-                    if primary and primary.getText() == "self":
-                        field_name = expr_ctx.IDENTIFIER().getText()
-                        return field_types.get(field_name)
+                field_name = self_member_field(expr_ctx)
+                if field_name is not None:
+                    return field_types.get(field_name)
             return None
 
         def find_params_in_expr(expr_ctx) -> list[str]:
@@ -1552,15 +1629,23 @@ class SymbolTableVisitor(zincVisitor):
             search(expr_ctx)
             return found
 
-        def walk(node):
+        def infer_from_params(params_found: list[str], field_type: str) -> None:
+            for param_name in params_found:
+                if param_name not in inferred:
+                    inferred[param_name] = field_type
+
+        def walk(node, in_return: bool) -> None:
+            nonlocal reads, writes, return_type
             if node is None:
                 return
 
-            # Check for return statements with struct instantiation
             if isinstance(node, ZincParser.ReturnStatementContext):
-                if node.expression():
+                if return_type_of is not None and not return_type and not in_return and node.expression():
+                    return_type = return_type_of(node.expression())
+                in_return = True
+                # Returning a struct instantiation: field values that are params take the field type
+                if infer_params and node.expression():
                     expr = node.expression()
-                    # Check if returning struct instantiation
                     if isinstance(expr, ZincParser.PrimaryExprContext):
                         primary = expr.primaryExpression()
                         if primary and primary.structInstantiation():
@@ -1571,71 +1656,62 @@ class SymbolTableVisitor(zincVisitor):
                                     continue
                                 field_name = field_init.IDENTIFIER().getText()
                                 field_value = field_init.expression().getText()
-                                # If field value is a parameter name
                                 if field_value in param_names and field_name in field_types:
                                     inferred[field_value] = field_types[field_name]
 
-            # Check for self.field = expr assignments
-            if isinstance(node, ZincParser.VariableAssignmentContext):
-                target = node.assignmentTarget()
-                if target.memberAccess():
-                    member = target.memberAccess()
-                    target_expr = member.expression()
-                    if isinstance(target_expr, ZincParser.PrimaryExprContext):
-                        primary = target_expr.primaryExpression()
-                        if primary and primary.getText() == "self":
-                            field_name = member.IDENTIFIER().getText()
+            # self.field = ... is a write, and its RHS params take the field type
+            elif isinstance(node, ZincParser.VariableAssignmentContext):
+                member = node.assignmentTarget().memberAccess()
+                if member:
+                    field_name = self_member_field(member)
+                    if field_name is not None:
+                        writes = True
+                        if infer_params:
                             field_type = field_types.get(field_name)
                             if field_type:
-                                # Find params used in the RHS expression
-                                rhs_expr = node.expression()
-                                params_in_rhs = find_params_in_expr(rhs_expr)
-                                for param_name in params_in_rhs:
-                                    if param_name not in inferred:
-                                        inferred[param_name] = field_type
-
-            # Check for binary expressions mixing self.field and params
-            if isinstance(node, (ZincParser.AdditiveExprContext, ZincParser.MultiplicativeExprContext)):
+                                infer_from_params(find_params_in_expr(node.expression()), field_type)
+
+            # self.field access is a read
+            elif isinstance(node, ZincParser.MemberAccessExprContext):
+                if self_member_field(node) is not None:
+                    reads = True
+
+            # self in string interpolations is a read
+            elif isinstance(node, ZincParser.LiteralContext):
+                if node.STRING() and "{self." in node.STRING().getText():
+                    reads = True
+
+            # Binary expressions mixing self.field and params
+            elif infer_params and isinstance(node, (ZincParser.AdditiveExprContext, ZincParser.MultiplicativeExprContext)):
                 left = node.expression(0)
                 right = node.expression(1)
                 left_type = get_self_field_type(left)
                 right_type = get_self_field_type(right)
-                # If one side is a self.field, infer type for params on the other side
                 if left_type:
-                    params_in_right = find_params_in_expr(right)
-                    for param_name in params_in_right:
-                        if param_name not in inferred:
-                            inferred[param_name] = left_type
+                    infer_from_params(find_params_in_expr(right), left_type)
                 if right_type:
-                    params_in_left = find_params_in_expr(left)
-                    for param_name in params_in_left:
-                        if param_name not in inferred:
-                            inferred[param_name] = right_type
+                    infer_from_params(find_params_in_expr(left), right_type)
 
-            # Recurse
+            # Recurse into children
             if hasattr(node, "getChildCount"):
                 for i in range(node.getChildCount()):
                     child = node.getChild(i)
                     if isinstance(child, ParserRuleContext):
-                        walk(child)
+                        walk(child, in_return)
 
-        walk(block_ctx)
+        walk(block_ctx, False)
 
-        # Build result with inferred types
-        result = []
-        for name, type_ann, _ in params:
-            resolved = inferred.get(name)
-            result.append((name, type_ann, resolved))
-        return result
+        resolved_params = [(name, type_ann, inferred.get(name)) for name, type_ann, _ in params]
+        return reads, writes, resolved_params, return_type or None
 
-    def _infer_return_type(
+    def _method_return_expr_type(
         self,
-        block_ctx,
+        expr_ctx,
         field_types: dict[str, str],
         source_module_id: str,
         constructor_owner_qualified_name: str,
     ) -> str | None:
-        """Infer return type from return statements."""
+        """Infer the Rust type name of a method return expression, if possible."""
 
         def get_expr_type(expr_ctx) -> str | None:
             """Get type of an expression if we can infer it."""
@@ -1645,7 +1721,7 @@ class SymbolTableVisitor(zincVisitor):
             # Struct instantiation
             if isinstance(expr_ctx, ZincParser.PrimaryExprContext):
                 primary = expr_ctx.primaryExpression()
-                if primary and hasattr(primary, "enumVariantConstruction") and primary.enumVariantConstruction():
+                if primary and primary.enumVariantConstruction():
                     inst = primary.enumVariantConstruction()
                     variant_target = self.module_graph.resolve_enum_variant_path(
                         source_module_id,
@@ -1682,7 +1758,7 @@ class SymbolTableVisitor(zincVisitor):
                 target_expr = expr_ctx.expression()
                 if isinstance(target_expr, ZincParser.PrimaryExprContext):
                     primary = target_expr.primaryExpression()
-                    if primary and primary.getText() == "self":
+                    if primary and primary.SELF() is not None:
                         field_name = expr_ctx.IDENTIFIER().getText()
                         return field_types.get(field_name)
 
@@ -1699,26 +1775,7 @@ class SymbolTableVisitor(zincVisitor):
 
             return None
 
-        def find_return_type(node) -> str | None:
-            if node is None:
-                return None
-
-            if isinstance(node, ZincParser.ReturnStatementContext):
-                if not node.expression():
-                    return None
-                return get_expr_type(node.expression())
-
-            # Recurse
-            if hasattr(node, "getChildCount"):
-                for i in range(node.getChildCount()):
-                    child = node.getChild(i)
-                    if isinstance(child, ParserRuleContext):
-                        result = find_return_type(child)
-                        if result:
-                            return result
-            return None
-
-        return find_return_type(block_ctx)
+        return get_expr_type(expr_ctx)
 
     def _validate_composed_struct_methods(
         self,
@@ -1761,7 +1818,7 @@ class SymbolTableVisitor(zincVisitor):
                 target_expr = member.expression()
                 if isinstance(target_expr, ZincParser.PrimaryExprContext):
                     primary = target_expr.primaryExpression()
-                    if primary and primary.getText() == "self":
+                    if primary and primary.SELF() is not None:
                         field_name = member.IDENTIFIER().getText()
                         expected = field_types.get(field_name)
                         if expected is None:
@@ -1785,7 +1842,7 @@ class SymbolTableVisitor(zincVisitor):
                 receiver = callee_ctx.expression()
                 if isinstance(receiver, ZincParser.PrimaryExprContext):
                     primary = receiver.primaryExpression()
-                    if primary and primary.getText() == "self":
+                    if primary and primary.SELF() is not None:
                         callee_name = callee_ctx.IDENTIFIER().getText()
                         if callee_name not in method_types:
                             raise ZincTypeError(f"composed method '{struct_name}.{method_name}' calls missing method '{callee_name}'")
@@ -1794,7 +1851,7 @@ class SymbolTableVisitor(zincVisitor):
             target_expr = node.expression()
             if isinstance(target_expr, ZincParser.PrimaryExprContext):
                 primary = target_expr.primaryExpression()
-                if primary and primary.getText() == "self":
+                if primary and primary.SELF() is not None:
                     field_name = node.IDENTIFIER().getText()
                     if field_name not in field_types and field_name not in method_types:
                         raise ZincTypeError(f"composed method '{struct_name}.{method_name}' references missing member '{field_name}'")
@@ -1816,7 +1873,7 @@ class SymbolTableVisitor(zincVisitor):
         """Return True when a method body references the special self binding."""
         if node is None:
             return False
-        if isinstance(node, ZincParser.PrimaryExpressionContext) and node.getText() == "self":
+        if isinstance(node, ZincParser.PrimaryExpressionContext) and node.SELF() is not None:
             return True
         if hasattr(node, "getChildCount"):
             for i in range(node.getChildCount()):
@@ -1848,7 +1905,7 @@ class SymbolTableVisitor(zincVisitor):
                 return param_types.get(primary.IDENTIFIER().getText(), BaseType.UNKNOWN)
             if primary.structInstantiation():
                 return BaseType.STRUCT
-            if primary.getText() == "self":
+            if primary.SELF() is not None:
                 return BaseType.STRUCT
             return BaseType.UNKNOWN
 
@@ -1856,7 +1913,7 @@ class SymbolTableVisitor(zincVisitor):
             receiver = expr_ctx.expression()
             if isinstance(receiver, ZincParser.PrimaryExprContext):
                 primary = receiver.primaryExpression()
-                if primary and primary.getText() == "self":
+                if primary and primary.SELF() is not None:
                     member_name = expr_ctx.IDENTIFIER().getText()
                     if member_name in field_types:
                         return field_types[member_name]
@@ -1903,7 +1960,7 @@ class SymbolTableVisitor(zincVisitor):
                 method_types,
                 param_types,
             )
-            result = TypeInfo.promote(TypeInfo(left), TypeInfo(right)).base
+            result = TypeInfo.promote(TypeInfo.of(left), TypeInfo.of(right)).base
             if result == BaseType.UNKNOWN and left != BaseType.UNKNOWN and right != BaseType.UNKNOWN:
                 raise ZincTypeError(f"composed method '{struct_name}.{method_name}' uses incompatible operand types")
             return result
@@ -1920,7 +1977,7 @@ class SymbolTableVisitor(zincVisitor):
                 receiver = callee_ctx.expression()
                 if isinstance(receiver, ZincParser.PrimaryExprContext):
                     primary = receiver.primaryExpression()
-                    if primary and primary.getText() == "self":
+                    if primary and primary.SELF() is not None:
                         callee_name = callee_ctx.IDENTIFIER().getText()
                         if callee_name not in method_types:
                             raise ZincTypeError(f"composed method '{struct_name}.{method_name}' calls missing method '{callee_name}'")
@@ -1950,7 +2007,7 @@ class SymbolTableVisitor(zincVisitor):
         """Return the exact scalar type encoded by a type annotation, if any."""
         if type_ctx is None:
             return None
-        exact_type = self._exact_type_name_from_text(type_ctx.getText())
+        exact_type = self._exact_type_name_from_text(self._ctx_text(type_ctx))
         if exact_type is not None:
             return exact_type
         if hasattr(type_ctx, "qualifiedName") and type_ctx.qualifiedName() and not type_ctx.typeList():
@@ -2020,14 +2077,15 @@ class SymbolTableVisitor(zincVisitor):
     def _validate_parameter_defaults_for_ctx(self, ctx, label: str, owner_module_id: str | None) -> None:
         """Validate default parameter ordering, const-ness, and annotations."""
         specs = self._parameter_specs_from_ctx(ctx, owner_module_id)
-        if is_arrow_lambda_context(ctx) and any(spec.default_expr is not None for spec in specs):
-            raise ZincTypeError("arrow lambda parameters cannot have defaults")
+        is_arrow_lambda = is_arrow_lambda_context(ctx)
         seen_default = False
         for spec in specs:
             if spec.default_expr is None:
                 if seen_default:
                     raise ZincTypeError(f"{label} parameter '{spec.name}' must have a default because an earlier parameter has one")
                 continue
+            if is_arrow_lambda:
+                raise ZincTypeError("arrow lambda parameters cannot have defaults")
             seen_default = True
             if not self._is_allowed_parameter_default(spec.default_expr, owner_module_id):
                 raise ZincTypeError(f"{label} parameter '{spec.name}' default must be a literal or compile-time constant")
@@ -2087,23 +2145,21 @@ class SymbolTableVisitor(zincVisitor):
                 expected_array=expected_array,
                 actual_array=self._array_info_from_symbol(default_symbol),
                 expected_dict=expected_dict,
-                actual_dict=self._copy_dict_info(default_symbol.dict_info) if default_symbol else None,
+                actual_dict=default_symbol.dict_info if default_symbol else None,
                 expected_set=expected_set,
-                actual_set=self._copy_set_info(default_symbol.set_info) if default_symbol else None,
+                actual_set=default_symbol.set_info if default_symbol else None,
                 expected_tuple=expected_tuple,
-                actual_tuple=self._copy_tuple_info(default_symbol.tuple_info) if default_symbol else None,
+                actual_tuple=default_symbol.tuple_info if default_symbol else None,
                 expected_callable=expected_callable,
-                actual_callable=self._copy_callable_info(default_symbol.callable_info) if default_symbol else None,
+                actual_callable=default_symbol.callable_info if default_symbol else None,
                 expected_struct_qualified_name=expected_struct_qualified_name,
                 actual_struct_qualified_name=self._struct_qualified_name_for_symbol(default_symbol),
                 expected_anonymous_struct_info=expected_anonymous_struct_info,
-                actual_anonymous_struct_info=self._copy_anonymous_struct_info(default_symbol.anonymous_struct_info)
-                if default_symbol
-                else None,
+                actual_anonymous_struct_info=default_symbol.anonymous_struct_info if default_symbol else None,
                 expected_result=expected_result,
-                actual_result=self._copy_result_info(default_symbol.result_info) if default_symbol else None,
+                actual_result=default_symbol.result_info if default_symbol else None,
                 expected_option=expected_option,
-                actual_option=self._copy_option_info(default_symbol.option_info) if default_symbol else None,
+                actual_option=default_symbol.option_info if default_symbol else None,
             ):
                 raise ZincTypeError(f"parameter '{spec.name}' default expects a compatible '{type_ctx.getText()}' value")
 
@@ -2161,7 +2217,7 @@ class SymbolTableVisitor(zincVisitor):
         if type_ctx is None:
             return BaseType.UNKNOWN, None, None, None, None, None, None, None, None, None
 
-        if type_ctx.getText() == "()":
+        if self._ctx_text(type_ctx) == "()":
             return BaseType.VOID, None, None, None, None, None, None, None, None, None
 
         if hasattr(type_ctx, "anonymousStructType") and type_ctx.anonymousStructType():
@@ -2392,7 +2448,7 @@ class SymbolTableVisitor(zincVisitor):
             )
 
         if type_ctx.qualifiedName():
-            type_name = type_ctx.qualifiedName().getText()
+            type_name = self._ctx_text(type_ctx.qualifiedName())
             base_type = self._type_name_to_base(type_name)
             type_list = type_ctx.typeList()
             if type_list and base_type == BaseType.UNKNOWN:
@@ -3029,23 +3085,23 @@ class SymbolTableVisitor(zincVisitor):
             expected_exact_type=expected.exact_type,
             actual_exact_type=actual.exact_type,
             expected_array=expected.array_info,
-            actual_array=self._copy_array_info(actual.array_info),
+            actual_array=actual.array_info,
             expected_dict=expected.dict_info,
-            actual_dict=self._copy_dict_info(actual.dict_info),
+            actual_dict=actual.dict_info,
             expected_set=expected.set_info,
-            actual_set=self._copy_set_info(actual.set_info),
+            actual_set=actual.set_info,
             expected_tuple=expected.tuple_info,
-            actual_tuple=self._copy_tuple_info(actual.tuple_info),
+            actual_tuple=actual.tuple_info,
             expected_callable=expected.callable_info,
-            actual_callable=self._copy_callable_info(actual.callable_info),
+            actual_callable=actual.callable_info,
             expected_struct_qualified_name=expected.struct_qualified_name,
             actual_struct_qualified_name=actual.struct_qualified_name,
             expected_anonymous_struct_info=expected.anonymous_struct_info,
-            actual_anonymous_struct_info=self._copy_anonymous_struct_info(actual.anonymous_struct_info),
+            actual_anonymous_struct_info=actual.anonymous_struct_info,
             expected_result=expected.result_info,
-            actual_result=self._copy_result_info(actual.result_info),
+            actual_result=actual.result_info,
             expected_option=expected.option_info,
-            actual_option=self._copy_option_info(actual.option_info),
+            actual_option=actual.option_info,
         )
 
     def _operator_instance_accepts(
@@ -3079,8 +3135,7 @@ class SymbolTableVisitor(zincVisitor):
         """Choose one ranked operator candidate, record it, and return its result info."""
         if not candidates:
             return None
-        candidates.sort(key=lambda item: item[0])
-        best_rank = candidates[0][0]
+        best_rank = min(candidate[0] for candidate in candidates)
         best = [candidate for candidate in candidates if candidate[0] == best_rank]
         if len(best) > 1:
             raise ZincTypeError(f"operator '{symbol}' is ambiguous for operands")
@@ -4396,7 +4451,7 @@ class SymbolTableVisitor(zincVisitor):
             primary = expr_ctx.primaryExpression()
             name_token = None
             if primary is not None:
-                name_token = primary.IDENTIFIER() or (primary.TYPE_KW() if hasattr(primary, "TYPE_KW") else None)
+                name_token = primary.IDENTIFIER() or primary.TYPE_KW()
             if name_token is not None:
                 name = name_token.getText()
                 symbol = self.symbols.lookup_by_id(name)
@@ -4642,7 +4697,7 @@ class SymbolTableVisitor(zincVisitor):
                 primary = callee.primaryExpression()
                 name_token = None
                 if primary is not None:
-                    name_token = primary.IDENTIFIER() or (primary.TYPE_KW() if hasattr(primary, "TYPE_KW") else None)
+                    name_token = primary.IDENTIFIER() or primary.TYPE_KW()
                 if name_token is not None:
                     func_name = name_token.getText()
                     if func_name == "type":
@@ -4679,7 +4734,7 @@ class SymbolTableVisitor(zincVisitor):
         if isinstance(expr_ctx, ZincParser.EqualityExprContext):
             left = self._evaluate_constraint_expr(expr_ctx.expression(0), slots)
             right = self._evaluate_constraint_expr(expr_ctx.expression(1), slots)
-            return left == right if expr_ctx.getChild(1).getText() == "==" else left != right
+            return left == right if binary_operator(expr_ctx) == "==" else left != right
         if isinstance(expr_ctx, ZincParser.MembershipExprContext):
             left = self._evaluate_constraint_expr(expr_ctx.expression(0), slots)
             right = self._evaluate_constraint_expr(expr_ctx.expression(1), slots)
@@ -4721,7 +4776,7 @@ class SymbolTableVisitor(zincVisitor):
     ) -> dict[str, MetaValue]:
         """Build the slot->TypeMeta environment for parameter constraints."""
         slots: dict[str, MetaValue] = {}
-        for index, param in enumerate(function_parameters(ctx)):
+        for index, param in enumerate(self._function_parameters(ctx)):
             if index >= len(arg_types):
                 continue
             slots[param.name] = self._type_meta_from_base(
@@ -5002,11 +5057,9 @@ class SymbolTableVisitor(zincVisitor):
                 stmt_ctx.block(),
                 self._visit_block_statements(stmt_ctx.block(), as_value=True),
             )
-        if stmt_ctx.ifStatement():
-            return self._unwrap_try_value(
-                stmt_ctx.ifStatement(),
-                self._analyze_if_statement_as_value(stmt_ctx.ifStatement()),
-            )
+        if_ctx = stmt_ctx.ifStatement()
+        if if_ctx:
+            return self._unwrap_try_value(if_ctx, self._analyze_if_statement_as_value(if_ctx))
         if stmt_ctx.returnStatement():
             self.visit(stmt_ctx.returnStatement())
             return ResolvedValueInfo(BaseType.NEVER)
@@ -5049,20 +5102,21 @@ class SymbolTableVisitor(zincVisitor):
     def _analyze_if_expression_ctx(self, ctx) -> ResolvedValueInfo:
         """Resolve the value type of an expression-form if."""
         self._require_boolean_condition(ctx.expression(), "if condition")
+        blocks = ctx.block()
         then_scope = self._next_block_name("if")
         self.symbols.enter_scope(then_scope)
         try:
-            then_value = self._visit_block_statements(ctx.block(0), as_value=True)
+            then_value = self._visit_block_statements(blocks[0], as_value=True)
         finally:
             self.symbols.exit_scope()
 
         else_value: ResolvedValueInfo | None = None
         if ctx.ELSE():
-            if len(ctx.block()) > 1:
+            if len(blocks) > 1:
                 else_scope = self._next_block_name("if")
                 self.symbols.enter_scope(else_scope)
                 try:
-                    else_value = self._visit_block_statements(ctx.block(1), as_value=True)
+                    else_value = self._visit_block_statements(blocks[1], as_value=True)
                 finally:
                     self.symbols.exit_scope()
             else:
@@ -5076,24 +5130,28 @@ class SymbolTableVisitor(zincVisitor):
 
     def _analyze_if_statement_as_value(self, ctx: ZincParser.IfStatementContext) -> ResolvedValueInfo:
         """Resolve the value type of a statement-form if used in tail position."""
-        if len(ctx.block()) > len(ctx.expression()):
+        conditions = ctx.expression()
+        blocks = ctx.block()
+        condition_count = len(conditions)
+        has_else = len(blocks) > condition_count
+        if has_else:
             else_scope = self._next_block_name("if")
             self.symbols.enter_scope(else_scope)
             try:
-                else_value = self._visit_block_statements(ctx.block(-1), as_value=True)
+                else_value = self._visit_block_statements(blocks[-1], as_value=True)
             finally:
                 self.symbols.exit_scope()
         else:
             else_value = ResolvedValueInfo(BaseType.VOID)
-        for index in range(len(ctx.expression()) - 1, -1, -1):
-            self._require_boolean_condition(ctx.expression(index), "if condition")
+        for index in range(condition_count - 1, -1, -1):
+            self._require_boolean_condition(conditions[index], "if condition")
             branch_scope = self._next_block_name("if")
             self.symbols.enter_scope(branch_scope)
             try:
-                branch_value = self._visit_block_statements(ctx.block(index), as_value=True)
+                branch_value = self._visit_block_statements(blocks[index], as_value=True)
             finally:
                 self.symbols.exit_scope()
-            if index == len(ctx.expression()) - 1 and len(ctx.block()) == len(ctx.expression()):
+            if index == condition_count - 1 and not has_else:
                 if branch_value.base_type not in {BaseType.VOID, BaseType.NEVER}:
                     raise ZincTypeError("if-expression without else must resolve to unit or diverge")
             else_value = self._merge_value_infos(branch_value, else_value)
@@ -5774,25 +5832,34 @@ class SymbolTableVisitor(zincVisitor):
         """Return the scoped call-site key shared with code generation."""
         return (self._current_function, ctx.getSourceInterval())
 
-    def _raw_call_arguments(self, argument_list_ctx) -> list[RawCallArgument]:
-        """Return syntactic call arguments without applying parameter binding."""
+    def _raw_call_arguments(self, argument_list_ctx) -> tuple[RawCallArgument, ...]:
+        """Return syntactic call arguments without applying parameter binding.
+
+        The result is memoized per argument list node, since binding, visiting
+        and specialization each walk the same call site.
+        """
         if argument_list_ctx is None:
-            return []
-        return [
-            RawCallArgument(
-                name=arg_ctx.IDENTIFIER().getText() if arg_ctx.IDENTIFIER() and arg_ctx.EQ() else None,
-                expression=arg_ctx.expression(),
-                ctx=arg_ctx,
-                is_spread=bool(arg_ctx.DOTDOT()),
+            return ()
+        key = ("raw_call_arguments", argument_list_ctx)
+        cached = self._parse_node_cache.get(key)
+        if cached is None:
+            cached = tuple(
+                RawCallArgument(
+                    name=arg_ctx.IDENTIFIER().getText() if arg_ctx.IDENTIFIER() and arg_ctx.EQ() else None,
+                    expression=arg_ctx.expression(),
+                    ctx=arg_ctx,
+                    is_spread=bool(arg_ctx.DOTDOT()),
+                )
+                for arg_ctx in argument_list_ctx.argument()
             )
-            for arg_ctx in argument_list_ctx.argument()
-        ]
+            self._parse_node_cache[key] = cached
+        return cached
 
     def _raw_call_exprs(self, ctx) -> list:
         """Return call argument expressions in written order."""
         return [arg.expression for arg in self._raw_call_arguments(ctx.argumentList())]
 
-    def _require_positional_arguments(self, raw_args: list[RawCallArgument], label: str) -> None:
+    def _require_positional_arguments(self, raw_args: tuple[RawCallArgument, ...], label: str) -> None:
         """Reject named/spread arguments for builtins and builtin collection methods."""
         if any(arg.name is not None or arg.is_spread for arg in raw_args):
             raise ZincTypeError(f"{label} does not accept named arguments")
@@ -5806,7 +5873,7 @@ class SymbolTableVisitor(zincVisitor):
                 default_expr=param.default_expr,
                 owner_module_id=owner_module_id,
             )
-            for param in function_parameters(ctx)
+            for param in self._function_parameters(ctx)
         ]
 
     def _parameter_specs_from_method(self, method: StructMethodInfo) -> list[ParameterSpec]:
@@ -6298,7 +6365,7 @@ class SymbolTableVisitor(zincVisitor):
         if function_is_operator(func_def):
             return None
         label = f"{'spawn call' if is_spawn else 'call'} to '{display_name}'"
-        params = function_parameters(func_def)
+        params = self._function_parameters(func_def)
         if not params:
             raise ZincTypeError(f"{label} requires at least one parameter for the UFCS receiver")
         receiver_param = params[0]
@@ -6397,10 +6464,7 @@ class SymbolTableVisitor(zincVisitor):
         if func_instance:
             if is_spawn:
                 func_instance.is_async = True
-            for idx, chan_info in arg_channel_infos.items():
-                func_instance.arg_channel_infos.setdefault(idx, [])
-                if all(existing is not chan_info for existing in func_instance.arg_channel_infos[idx]):
-                    func_instance.arg_channel_infos[idx].append(chan_info)
+            self._record_caller_channel_infos(func_instance, arg_channel_infos)
             self._mark_mutated_call_arguments(func_instance, arg_exprs)
 
         if is_spawn:
@@ -6938,17 +7002,23 @@ class SymbolTableVisitor(zincVisitor):
                     self._struct_symbol_bindings[capture_symbol.unique_name] = capture.struct_qualified_name
 
         # Define parameters with types from func.arg_types
-        # Track parameter names for mutation detection
-        param_names: list[str] = []
-        for i, param in enumerate(function_parameters(ctx)):
+        # Track collection/callable parameters whose metadata is written back after the body
+        tracked_params: list[tuple[int, str]] = []
+        for i, param in enumerate(self._function_parameters(ctx)):
             param_ctx = param.ctx
             param_name = param.name
-            param_names.append(param_name)
             # Use arg type from specialization if available
             if i < len(func.arg_types):
                 param_type = func.arg_types[i]
             else:
                 param_type = BaseType.UNKNOWN
+            if (
+                i in func.arg_array_infos
+                or i in func.arg_dict_infos
+                or i in func.arg_set_infos
+                or (i < len(func.arg_types) and param_type == BaseType.CALLABLE)
+            ):
+                tracked_params.append((i, param_name))
             param_exact_type = func.arg_exact_types[i] if i < len(func.arg_exact_types) else None
             type_ctx = self._single_type_ctx(param_ctx) if param_ctx is not None else None
             annotated_type = BaseType.UNKNOWN
@@ -7174,30 +7244,26 @@ class SymbolTableVisitor(zincVisitor):
         self._discover_decorator_function_specializations(func)
 
         # Update array parameter mutation info
-        for i, param_name in enumerate(param_names):
-            if i in func.arg_array_infos:
-                param_symbol = self.symbols.lookup_by_id(param_name)
-                if param_symbol and param_symbol.is_mutated:
+        for i, param_name in tracked_params:
+            param_symbol = self.symbols.lookup_by_id(param_name)
+            if param_symbol is None:
+                continue
+            if param_symbol.is_mutated:
+                if i in func.arg_array_infos:
                     func.arg_array_infos[i].is_mutated = True
-            if i in func.arg_dict_infos:
-                param_symbol = self.symbols.lookup_by_id(param_name)
-                if param_symbol and param_symbol.is_mutated:
+                if i in func.arg_dict_infos:
                     func.arg_dict_infos[i].is_mutated = True
-            if i in func.arg_set_infos:
-                param_symbol = self.symbols.lookup_by_id(param_name)
-                if param_symbol and param_symbol.is_mutated:
+                if i in func.arg_set_infos:
                     func.arg_set_infos[i].is_mutated = True
-            if i < len(func.arg_types) and func.arg_types[i] == BaseType.CALLABLE:
-                param_symbol = self.symbols.lookup_by_id(param_name)
-                if param_symbol and param_symbol.callable_info:
-                    func.arg_callable_infos[i] = (
-                        self._merge_callable_info(
-                            func.arg_callable_infos.get(i),
-                            param_symbol.callable_info,
-                            f"function parameter '{param_name}'",
-                        )
-                        or CallableTypeInfo()
+            if i < len(func.arg_types) and func.arg_types[i] == BaseType.CALLABLE and param_symbol.callable_info:
+                func.arg_callable_infos[i] = (
+                    self._merge_callable_info(
+                        func.arg_callable_infos.get(i),
+                        param_symbol.callable_info,
+                        f"function parameter '{param_name}'",
                     )
+                    or CallableTypeInfo()
+                )
 
         self.symbols.exit_scope()
         self._current_function = None
@@ -7205,12 +7271,9 @@ class SymbolTableVisitor(zincVisitor):
 
     def _validate_resolved_collections(self, function_scope: str) -> None:
         """Reject empty collection types that were never constrained."""
-        prefix = f"{function_scope}."
-        for symbol in self.symbols.all_symbols():
+        for symbol in self.symbols.function_symbols(function_scope):
             if symbol.kind not in {SymbolKind.VARIABLE, SymbolKind.PARAMETER}:
                 continue
-            if not symbol.unique_name.startswith(prefix):
-                continue
             if symbol.resolved_type == BaseType.ARRAY and (symbol.element_type is None or symbol.element_type == BaseType.UNKNOWN):
                 raise ZincTypeError(f"cannot infer type for empty array '{symbol.id}'")
             if symbol.dict_info and (symbol.dict_info.key_type == BaseType.UNKNOWN or symbol.dict_info.value_type == BaseType.UNKNOWN):
@@ -7306,7 +7369,7 @@ class SymbolTableVisitor(zincVisitor):
             raise ZincTypeError("lexical functions require a body")
 
         local_names: set[str] = set()
-        local_names.update(param.name for param in function_parameters(ctx))
+        local_names.update(param.name for param in self._function_parameters(ctx))
 
         local_function_names: set[str] = set()
 
@@ -7369,59 +7432,75 @@ class SymbolTableVisitor(zincVisitor):
             captures.append(self._copy_capture_binding_info(outer_symbol))
             seen_bindings.add(outer_symbol.unique_name)
 
+        def walk_primary(node) -> None:
+            if node.IDENTIFIER():
+                record_capture(node.IDENTIFIER().getText())
+
+        def walk_out_assignment(node) -> None:
+            tokens = list(node.getTokens(ZincParser.IDENTIFIER))
+            if len(tokens) >= 2 and tokens[0].getText() == "out":
+                record_capture(tokens[1].getText())
+            walk(node.expression())
+
+        def skip_nested_function(_node) -> None:
+            return
+
+        def walk_assignment(node) -> None:
+            walk(node.expression())
+            target = node.assignmentTarget()
+            if target.IDENTIFIER():
+                local_names.add(target.IDENTIFIER().getText())
+            elif target.tupleAssignmentTarget():
+                local_names.update(token.getText() for token in target.tupleAssignmentTarget().getTokens(ZincParser.IDENTIFIER))
+
+        def walk_typed_assignment(node) -> None:
+            walk(node.expression())
+            local_names.update(token.getText() for token in self._typed_assignment_tokens(node.typedAssignmentTarget()))
+
+        def walk_for(node) -> None:
+            walk(node.expression())
+            binding = node.forBinding()
+            if binding.IDENTIFIER():
+                local_names.add(binding.IDENTIFIER().getText())
+            elif binding.tupleAssignmentTarget():
+                local_names.update(token.getText() for token in binding.tupleAssignmentTarget().getTokens(ZincParser.IDENTIFIER))
+            walk(node.block())
+
+        def walk_block(node) -> None:
+            nested_declared: list[str] = []
+            for stmt in node.statement():
+                if stmt.functionDeclaration():
+                    if function_is_operator(stmt.functionDeclaration()):
+                        raise ZincTypeError("operator declarations must be inside structs")
+                    nested_declared.append(function_name_from_ctx(stmt.functionDeclaration()))
+                if stmt.asyncFunctionDeclaration():
+                    nested_declared.append(stmt.asyncFunctionDeclaration().IDENTIFIER().getText())
+            previous_function_names = set(local_function_names)
+            local_function_names.update(nested_declared)
+            for stmt in node.statement():
+                walk(stmt)
+            local_function_names.clear()
+            local_function_names.update(previous_function_names)
+
+        # Keyed by exact context class: none of these rule contexts have labeled subclasses,
+        # so one dict lookup replaces a chain of isinstance checks on every visited node.
+        handlers: dict[type, Callable[[ParserRuleContext], None]] = {
+            ZincParser.PrimaryExpressionContext: walk_primary,
+            ZincParser.OutAssignmentContext: walk_out_assignment,
+            ZincParser.FunctionDeclarationContext: skip_nested_function,
+            ZincParser.AsyncFunctionDeclarationContext: skip_nested_function,
+            ZincParser.VariableAssignmentContext: walk_assignment,
+            ZincParser.TypedVariableAssignmentContext: walk_typed_assignment,
+            ZincParser.ForStatementContext: walk_for,
+            ZincParser.BlockContext: walk_block,
+        }
+
         def walk(node) -> None:
             if node is None:
                 return
-            if isinstance(node, ZincParser.PrimaryExpressionContext):
-                if node.IDENTIFIER():
-                    record_capture(node.IDENTIFIER().getText())
-                return
-            if isinstance(node, ZincParser.OutAssignmentContext):
-                tokens = list(node.getTokens(ZincParser.IDENTIFIER))
-                if len(tokens) >= 2 and tokens[0].getText() == "out":
-                    record_capture(tokens[1].getText())
-                walk(node.expression())
-                return
-            if isinstance(node, ZincParser.FunctionDeclarationContext):
-                return
-            if isinstance(node, ZincParser.AsyncFunctionDeclarationContext):
-                return
-            if isinstance(node, ZincParser.VariableAssignmentContext):
-                walk(node.expression())
-                target = node.assignmentTarget()
-                if target.IDENTIFIER():
-                    local_names.add(target.IDENTIFIER().getText())
-                elif target.tupleAssignmentTarget():
-                    local_names.update(token.getText() for token in target.tupleAssignmentTarget().getTokens(ZincParser.IDENTIFIER))
-                return
-            if isinstance(node, ZincParser.TypedVariableAssignmentContext):
-                walk(node.expression())
-                local_names.update(token.getText() for token in self._typed_assignment_tokens(node.typedAssignmentTarget()))
-                return
-            if isinstance(node, ZincParser.ForStatementContext):
-                walk(node.expression())
-                binding = node.forBinding()
-                if binding.IDENTIFIER():
-                    local_names.add(binding.IDENTIFIER().getText())
-                elif binding.tupleAssignmentTarget():
-                    local_names.update(token.getText() for token in binding.tupleAssignmentTarget().getTokens(ZincParser.IDENTIFIER))
-                walk(node.block())
-                return
-            if isinstance(node, ZincParser.BlockContext):
-                nested_declared: list[str] = []
-                for stmt in node.statement():
-                    if stmt.functionDeclaration():
-                        if function_is_operator(stmt.functionDeclaration()):
-                            raise ZincTypeError("operator declarations must be inside structs")
-                        nested_declared.append(function_name_from_ctx(stmt.functionDeclaration()))
-                    if stmt.asyncFunctionDeclaration():
-                        nested_declared.append(stmt.asyncFunctionDeclaration().IDENTIFIER().getText())
-                previous_function_names = set(local_function_names)
-                local_function_names.update(nested_declared)
-                for stmt in node.statement():
-                    walk(stmt)
-                local_function_names.clear()
-                local_function_names.update(previous_function_names)
+            handler = handlers.get(type(node))
+            if handler is not None:
+                handler(node)
                 return
             if hasattr(node, "getChildCount"):
                 for i in range(node.getChildCount()):
@@ -7455,11 +7534,11 @@ class SymbolTableVisitor(zincVisitor):
         param_anonymous_struct_infos: dict[int, AnonymousStructTypeInfo] = {}
         param_result_infos: dict[int, ResultTypeInfo] = {}
         param_option_infos: dict[int, OptionTypeInfo] = {}
-        for i, param in enumerate(function_parameters(ctx)):
+        for i, param in enumerate(self._function_parameters(ctx)):
             param_ctx = param.ctx
             param_names.append(param.name)
             if param.default_expr is not None:
-                param_default_texts[i] = param.default_expr.getText()
+                param_default_texts[i] = self._ctx_text(param.default_expr)
                 param_default_exprs[i] = param.default_expr
                 if target_module_id is not None:
                     param_default_owner_modules[i] = target_module_id
@@ -7758,7 +7837,7 @@ class SymbolTableVisitor(zincVisitor):
             return False
         if callable_info.return_type == BaseType.UNKNOWN:
             return False
-        if any(base_type == BaseType.UNKNOWN for base_type in callable_info.param_types):
+        if BaseType.UNKNOWN in callable_info.param_types:
             return False
         return all(self._callable_signature_is_concrete(nested) for nested in callable_info.param_callable_infos.values())
 
@@ -7796,10 +7875,10 @@ class SymbolTableVisitor(zincVisitor):
         param_default_texts: dict[int, str] = {}
         param_default_exprs: dict[int, ParserRuleContext] = {}
         param_default_owner_modules: dict[int, str] = {}
-        for index, param in enumerate(function_parameters(func.ctx)):
+        for index, param in enumerate(self._function_parameters(func.ctx)):
             param_names.append(param.name)
             if param.default_expr is not None:
-                param_default_texts[index] = param.default_expr.getText()
+                param_default_texts[index] = self._ctx_text(param.default_expr)
                 param_default_exprs[index] = param.default_expr
                 param_default_owner_modules[index] = func.module_id
         return CallableTypeInfo(
@@ -8328,7 +8407,7 @@ class SymbolTableVisitor(zincVisitor):
         arg_anonymous_struct_infos: dict[int, AnonymousStructTypeInfo],
     ) -> None:
         """Validate exact annotated parameters before specializing a function call."""
-        for i, param in enumerate(function_parameters(ctx)):
+        for i, param in enumerate(self._function_parameters(ctx)):
             param_ctx = param.ctx
             if param_ctx is None:
                 continue
@@ -8563,14 +8642,14 @@ class SymbolTableVisitor(zincVisitor):
         if ctx.literal():
             return self.visit(ctx.literal())
 
-        if hasattr(ctx, "unitLiteral") and ctx.unitLiteral():
+        if ctx.unitLiteral():
             self.symbols.define_temp(
                 resolved_type=BaseType.VOID,
                 interval=ctx.getSourceInterval(),
             )
             return BaseType.VOID
 
-        if hasattr(ctx, "builtinTypeQuery") and ctx.builtinTypeQuery():
+        if ctx.builtinTypeQuery():
             type_text = ctx.builtinTypeQuery().typeQueryType().getText()
             type_ctx = self._parse_type_annotation_text(type_text)
             if type_ctx is None:
@@ -8607,7 +8686,7 @@ class SymbolTableVisitor(zincVisitor):
             )
             return BaseType.STRUCT
 
-        if hasattr(ctx, "builtinResultOptionConstructor") and ctx.builtinResultOptionConstructor():
+        if ctx.builtinResultOptionConstructor():
             ctor = ctx.builtinResultOptionConstructor()
             result_expected, option_expected = self._expected_container_from_parent(ctx)
             if ctor.NONE():
@@ -8661,7 +8740,7 @@ class SymbolTableVisitor(zincVisitor):
                 temp.option_info = OptionTypeInfo(some_type=inner_info)
                 return BaseType.OPTION
 
-        name_token = ctx.IDENTIFIER() or (ctx.TYPE_KW() if hasattr(ctx, "TYPE_KW") else None)
+        name_token = ctx.IDENTIFIER() or ctx.TYPE_KW()
         if name_token:
             name = name_token.getText()
             symbol = self.symbols.lookup_by_id(name)
@@ -8772,16 +8851,16 @@ class SymbolTableVisitor(zincVisitor):
         if ctx.tupleLiteral():
             return self.visit(ctx.tupleLiteral())
 
-        if hasattr(ctx, "enumVariantConstruction") and ctx.enumVariantConstruction():
+        if ctx.enumVariantConstruction():
             return self.visit(ctx.enumVariantConstruction())
 
         if ctx.structInstantiation():
             return self.visit(ctx.structInstantiation())
 
-        if hasattr(ctx, "anonymousStructLiteral") and ctx.anonymousStructLiteral():
+        if ctx.anonymousStructLiteral():
             return self.visit(ctx.anonymousStructLiteral())
 
-        if ctx.getText() == "self":
+        if ctx.SELF() is not None:
             self.symbols.define_temp(
                 resolved_type=BaseType.STRUCT,
                 interval=ctx.getSourceInterval(),
@@ -8839,13 +8918,13 @@ class SymbolTableVisitor(zincVisitor):
                         expected_array=expected_field.array_info,
                         actual_array=actual_array_info,
                         expected_dict=expected_field.dict_info,
-                        actual_dict=self._copy_dict_info(actual_symbol.dict_info) if actual_symbol else None,
+                        actual_dict=actual_symbol.dict_info if actual_symbol else None,
                         expected_set=expected_field.set_info,
-                        actual_set=self._copy_set_info(actual_symbol.set_info) if actual_symbol else None,
+                        actual_set=actual_symbol.set_info if actual_symbol else None,
                         expected_tuple=expected_field.tuple_info,
-                        actual_tuple=self._copy_tuple_info(actual_symbol.tuple_info) if actual_symbol else None,
+                        actual_tuple=actual_symbol.tuple_info if actual_symbol else None,
                         expected_callable=expected_field.callable_info,
-                        actual_callable=self._copy_callable_info(actual_symbol.callable_info) if actual_symbol else None,
+                        actual_callable=actual_symbol.callable_info if actual_symbol else None,
                         expected_struct_qualified_name=expected_field.struct_qualified_name,
                         actual_struct_qualified_name=actual_struct_qualified_name,
                         expected_anonymous_struct_info=expected_field.anonymous_struct_info,
@@ -8901,13 +8980,13 @@ class SymbolTableVisitor(zincVisitor):
                 expected_array=expected_field.array_info,
                 actual_array=actual_array_info,
                 expected_dict=expected_field.dict_info,
-                actual_dict=self._copy_dict_info(actual_symbol.dict_info) if actual_symbol else None,
+                actual_dict=actual_symbol.dict_info if actual_symbol else None,
                 expected_set=expected_field.set_info,
-                actual_set=self._copy_set_info(actual_symbol.set_info) if actual_symbol else None,
+                actual_set=actual_symbol.set_info if actual_symbol else None,
                 expected_tuple=expected_field.tuple_info,
-                actual_tuple=self._copy_tuple_info(actual_symbol.tuple_info) if actual_symbol else None,
+                actual_tuple=actual_symbol.tuple_info if actual_symbol else None,
                 expected_callable=expected_field.callable_info,
-                actual_callable=self._copy_callable_info(actual_symbol.callable_info) if actual_symbol else None,
+                actual_callable=actual_symbol.callable_info if actual_symbol else None,
                 expected_struct_qualified_name=expected_field.struct_qualified_name,
                 actual_struct_qualified_name=actual_struct_qualified_name,
                 expected_anonymous_struct_info=expected_field.anonymous_struct_info,
@@ -8934,7 +9013,7 @@ class SymbolTableVisitor(zincVisitor):
         if self._current_module is None or self._current_function is None:
             raise ZincTypeError("lambda expressions require a function context")
         if is_arrow_lambda_context(ctx):
-            if any(param.default_expr is not None for param in function_parameters(ctx)):
+            if any(param.default_expr is not None for param in self._function_parameters(ctx)):
                 raise ZincTypeError("arrow lambda parameters cannot have defaults")
             if isinstance(arrow_lambda_body_expression(ctx), ZincParser.BlockExprContext):
                 raise ZincTypeError("arrow lambdas are expression-only; use fn(...) { ... } for block bodies")
@@ -8967,7 +9046,7 @@ class SymbolTableVisitor(zincVisitor):
 
     def visitPrimaryExpr(self, ctx: ZincParser.PrimaryExprContext) -> BaseType:
         """Visit primary expression wrapper."""
-        return self.visit(ctx.primaryExpression())
+        return self.visitPrimaryExpression(ctx.primaryExpression())
 
     def visitParenExpr(self, ctx: ZincParser.ParenExprContext) -> BaseType:
         """Handle parenthesized expressions."""
@@ -9049,17 +9128,18 @@ class SymbolTableVisitor(zincVisitor):
 
     def visitAdditiveExpr(self, ctx: ZincParser.AdditiveExprContext) -> BaseType:
         """Handle addition and subtraction."""
-        left_info = self._value_info_for_value_context(ctx.expression(0))
-        right_info = self._value_info_for_value_context(ctx.expression(1))
-        op = ctx.getChild(1).getText()
+        left_ctx, right_ctx = ctx.expression()
+        left_info = self._value_info_for_value_context(left_ctx)
+        right_info = self._value_info_for_value_context(right_ctx)
+        op = binary_operator(ctx)
         overload = self._resolve_binary_operator(ctx, op, left_info, right_info)
         if overload is not None:
             return overload.base_type
         left_type = left_info.base_type
         right_type = right_info.base_type
-        result_type = TypeInfo.promote(TypeInfo(left_type), TypeInfo(right_type)).base
-        left_symbol = self._expr_symbol(ctx.expression(0))
-        right_symbol = self._expr_symbol(ctx.expression(1))
+        result_type = TypeInfo.promote(TypeInfo.of(left_type), TypeInfo.of(right_type)).base
+        left_symbol = self._expr_symbol(left_ctx)
+        right_symbol = self._expr_symbol(right_ctx)
         constant_value = None
         if left_symbol and right_symbol and left_symbol.constant_value is not None and right_symbol.constant_value is not None:
             if op == "+":
@@ -9080,18 +9160,19 @@ class SymbolTableVisitor(zincVisitor):
 
     def _visit_bitwise_binary_expr(self, ctx) -> BaseType:
         """Handle integer bitwise AND, OR, and XOR."""
-        left_info = self._value_info_for_value_context(ctx.expression(0))
-        right_info = self._value_info_for_value_context(ctx.expression(1))
-        op = ctx.getChild(1).getText()
+        left_ctx, right_ctx = ctx.expression()
+        left_info = self._value_info_for_value_context(left_ctx)
+        right_info = self._value_info_for_value_context(right_ctx)
+        op = binary_operator(ctx)
         overload = self._resolve_binary_operator(ctx, op, left_info, right_info)
         if overload is not None:
             return overload.base_type
         if left_info.base_type != BaseType.INTEGER or right_info.base_type != BaseType.INTEGER:
             raise ZincTypeError(f"operator '{op}' requires integer operands")
 
-        left_symbol = self._expr_symbol(ctx.expression(0))
-        right_symbol = self._expr_symbol(ctx.expression(1))
-        result_exact_type = self._bitwise_result_exact_type(ctx.expression(0), ctx.expression(1), op)
+        left_symbol = self._expr_symbol(left_ctx)
+        right_symbol = self._expr_symbol(right_ctx)
+        result_exact_type = self._bitwise_result_exact_type(left_ctx, right_ctx, op)
         constant_value = None
         left_constant = self._integer_constant_value(left_symbol)
         right_constant = self._integer_constant_value(right_symbol)
@@ -9125,17 +9206,18 @@ class SymbolTableVisitor(zincVisitor):
 
     def visitShiftExpr(self, ctx: ZincParser.ShiftExprContext) -> BaseType:
         """Handle integer shift expressions."""
-        left_info = self._value_info_for_value_context(ctx.expression(0))
-        right_info = self._value_info_for_value_context(ctx.expression(1))
-        op = ctx.getChild(1).getText()
+        left_ctx, right_ctx = ctx.expression()
+        left_info = self._value_info_for_value_context(left_ctx)
+        right_info = self._value_info_for_value_context(right_ctx)
+        op = binary_operator(ctx)
         overload = self._resolve_binary_operator(ctx, op, left_info, right_info)
         if overload is not None:
             return overload.base_type
         if left_info.base_type != BaseType.INTEGER or right_info.base_type != BaseType.INTEGER:
             raise ZincTypeError(f"operator '{op}' requires integer operands")
 
-        left_symbol = self._expr_symbol(ctx.expression(0))
-        right_symbol = self._expr_symbol(ctx.expression(1))
+        left_symbol = self._expr_symbol(left_ctx)
+        right_symbol = self._expr_symbol(right_ctx)
         left_constant = self._integer_constant_value(left_symbol)
         right_constant = self._integer_constant_value(right_symbol)
         constant_value = None
@@ -9155,17 +9237,18 @@ class SymbolTableVisitor(zincVisitor):
 
     def visitMultiplicativeExpr(self, ctx: ZincParser.MultiplicativeExprContext) -> BaseType:
         """Handle multiplication, division, modulo."""
-        left_info = self._value_info_for_value_context(ctx.expression(0))
-        right_info = self._value_info_for_value_context(ctx.expression(1))
-        op = ctx.getChild(1).getText()
+        left_ctx, right_ctx = ctx.expression()
+        left_info = self._value_info_for_value_context(left_ctx)
+        right_info = self._value_info_for_value_context(right_ctx)
+        op = binary_operator(ctx)
         overload = self._resolve_binary_operator(ctx, op, left_info, right_info)
         if overload is not None:
             return overload.base_type
         left_type = left_info.base_type
         right_type = right_info.base_type
-        result_type = TypeInfo.promote(TypeInfo(left_type), TypeInfo(right_type)).base
-        left_symbol = self._expr_symbol(ctx.expression(0))
-        right_symbol = self._expr_symbol(ctx.expression(1))
+        result_type = TypeInfo.promote(TypeInfo.of(left_type), TypeInfo.of(right_type)).base
+        left_symbol = self._expr_symbol(left_ctx)
+        right_symbol = self._expr_symbol(right_ctx)
         constant_value = None
         if left_symbol and right_symbol and left_symbol.constant_value is not None and right_symbol.constant_value is not None:
             if op == "*":
@@ -9188,8 +9271,9 @@ class SymbolTableVisitor(zincVisitor):
 
     def visitPowerExpr(self, ctx: ZincParser.PowerExprContext) -> BaseType:
         """Handle exponentiation."""
-        left_info = self._value_info_for_value_context(ctx.expression(0))
-        right_info = self._value_info_for_value_context(ctx.expression(1))
+        left_ctx, right_ctx = ctx.expression()
+        left_info = self._value_info_for_value_context(left_ctx)
+        right_info = self._value_info_for_value_context(right_ctx)
         overload = self._resolve_binary_operator(ctx, "**", left_info, right_info)
         if overload is not None:
             return overload.base_type
@@ -9197,9 +9281,9 @@ class SymbolTableVisitor(zincVisitor):
         right_type = right_info.base_type
         if left_type not in {BaseType.INTEGER, BaseType.FLOAT} or right_type not in {BaseType.INTEGER, BaseType.FLOAT}:
             raise ZincTypeError("exponentiation requires numeric operands")
-        result_type = TypeInfo.promote(TypeInfo(left_type), TypeInfo(right_type)).base
-        left_symbol = self._expr_symbol(ctx.expression(0))
-        right_symbol = self._expr_symbol(ctx.expression(1))
+        result_type = TypeInfo.promote(TypeInfo.of(left_type), TypeInfo.of(right_type)).base
+        left_symbol = self._expr_symbol(left_ctx)
+        right_symbol = self._expr_symbol(right_ctx)
         constant_value = None
         if left_symbol and right_symbol and left_symbol.constant_value is not None and right_symbol.constant_value is not None:
             constant_value = left_symbol.constant_value**right_symbol.constant_value
@@ -9269,24 +9353,18 @@ class SymbolTableVisitor(zincVisitor):
 
     def visitRelationalExpr(self, ctx: ZincParser.RelationalExprContext) -> BaseType:
         """Handle relational comparisons."""
-        left_info = self._value_info_for_value_context(ctx.expression(0))
-        right_info = self._value_info_for_value_context(ctx.expression(1))
-        op = ctx.getChild(1).getText()
+        left_ctx, right_ctx = ctx.expression()
+        left_info = self._value_info_for_value_context(left_ctx)
+        right_info = self._value_info_for_value_context(right_ctx)
+        op = binary_operator(ctx)
         overload = self._resolve_binary_operator(ctx, op, left_info, right_info)
         if overload is not None:
             return overload.base_type
-        left_symbol = self._expr_symbol(ctx.expression(0))
-        right_symbol = self._expr_symbol(ctx.expression(1))
+        left_symbol = self._expr_symbol(left_ctx)
+        right_symbol = self._expr_symbol(right_ctx)
         constant_value = None
         if left_symbol and right_symbol and left_symbol.constant_value is not None and right_symbol.constant_value is not None:
-            if op == "<":
-                constant_value = left_symbol.constant_value < right_symbol.constant_value
-            elif op == "<=":
-                constant_value = left_symbol.constant_value <= right_symbol.constant_value
-            elif op == ">":
-                constant_value = left_symbol.constant_value > right_symbol.constant_value
-            elif op == ">=":
-                constant_value = left_symbol.constant_value >= right_symbol.constant_value
+            constant_value = _COMPARISON_FOLDS[op](left_symbol.constant_value, right_symbol.constant_value)
         self.symbols.define_temp(
             resolved_type=BaseType.BOOLEAN,
             interval=ctx.getSourceInterval(),
@@ -9297,20 +9375,18 @@ class SymbolTableVisitor(zincVisitor):
 
     def visitEqualityExpr(self, ctx: ZincParser.EqualityExprContext) -> BaseType:
         """Handle equality comparisons."""
-        left_info = self._value_info_for_value_context(ctx.expression(0))
-        right_info = self._value_info_for_value_context(ctx.expression(1))
-        op = ctx.getChild(1).getText()
+        left_ctx, right_ctx = ctx.expression()
+        left_info = self._value_info_for_value_context(left_ctx)
+        right_info = self._value_info_for_value_context(right_ctx)
+        op = binary_operator(ctx)
         overload = self._resolve_binary_operator(ctx, op, left_info, right_info)
         if overload is not None:
             return overload.base_type
-        left_symbol = self._expr_symbol(ctx.expression(0))
-        right_symbol = self._expr_symbol(ctx.expression(1))
+        left_symbol = self._expr_symbol(left_ctx)
+        right_symbol = self._expr_symbol(right_ctx)
         constant_value = None
         if left_symbol and right_symbol and left_symbol.constant_value is not None and right_symbol.constant_value is not None:
-            if op == "==":
-                constant_value = left_symbol.constant_value == right_symbol.constant_value
-            else:
-                constant_value = left_symbol.constant_value != right_symbol.constant_value
+            constant_value = _COMPARISON_FOLDS[op](left_symbol.constant_value, right_symbol.constant_value)
         self.symbols.define_temp(
             resolved_type=BaseType.BOOLEAN,
             interval=ctx.getSourceInterval(),
@@ -9321,13 +9397,14 @@ class SymbolTableVisitor(zincVisitor):
 
     def visitMembershipExpr(self, ctx: ZincParser.MembershipExprContext) -> BaseType:
         """Handle membership expressions like `x in [a, b]`."""
-        left_info = self._value_info_for_value_context(ctx.expression(0))
-        right_info = self._value_info_for_value_context(ctx.expression(1))
+        left_ctx, right_ctx = ctx.expression()
+        left_info = self._value_info_for_value_context(left_ctx)
+        right_info = self._value_info_for_value_context(right_ctx)
         overload = self._resolve_binary_operator(ctx, "in", left_info, right_info)
         if overload is not None:
             return overload.base_type
-        left_symbol = self._expr_symbol(ctx.expression(0))
-        right_symbol = self._expr_symbol(ctx.expression(1))
+        left_symbol = self._expr_symbol(left_ctx)
+        right_symbol = self._expr_symbol(right_ctx)
         constant_value = None
         if left_symbol and right_symbol and left_symbol.constant_value is not None and right_symbol.constant_value is not None:
             haystack = right_symbol.constant_value
@@ -9363,13 +9440,14 @@ class SymbolTableVisitor(zincVisitor):
 
     def visitLogicalAndExpr(self, ctx: ZincParser.LogicalAndExprContext) -> BaseType:
         """Handle logical AND."""
-        left_info = self._value_info_for_value_context(ctx.expression(0))
-        right_info = self._value_info_for_value_context(ctx.expression(1))
-        overload = self._resolve_binary_operator(ctx, ctx.getChild(1).getText(), left_info, right_info)
+        left_ctx, right_ctx = ctx.expression()
+        left_info = self._value_info_for_value_context(left_ctx)
+        right_info = self._value_info_for_value_context(right_ctx)
+        overload = self._resolve_binary_operator(ctx, binary_operator(ctx), left_info, right_info)
         if overload is not None:
             return overload.base_type
-        left_symbol = self._expr_symbol(ctx.expression(0))
-        right_symbol = self._expr_symbol(ctx.expression(1))
+        left_symbol = self._expr_symbol(left_ctx)
+        right_symbol = self._expr_symbol(right_ctx)
         constant_value = None
         if left_symbol and right_symbol and left_symbol.constant_value is not None and right_symbol.constant_value is not None:
             constant_value = bool(left_symbol.constant_value and right_symbol.constant_value)
@@ -9383,13 +9461,14 @@ class SymbolTableVisitor(zincVisitor):
 
     def visitLogicalOrExpr(self, ctx: ZincParser.LogicalOrExprContext) -> BaseType:
         """Handle logical OR."""
-        left_info = self._value_info_for_value_context(ctx.expression(0))
-        right_info = self._value_info_for_value_context(ctx.expression(1))
-        overload = self._resolve_binary_operator(ctx, ctx.getChild(1).getText(), left_info, right_info)
+        left_ctx, right_ctx = ctx.expression()
+        left_info = self._value_info_for_value_context(left_ctx)
+        right_info = self._value_info_for_value_context(right_ctx)
+        overload = self._resolve_binary_operator(ctx, binary_operator(ctx), left_info, right_info)
         if overload is not None:
             return overload.base_type
-        left_symbol = self._expr_symbol(ctx.expression(0))
-        right_symbol = self._expr_symbol(ctx.expression(1))
+        left_symbol = self._expr_symbol(left_ctx)
+        right_symbol = self._expr_symbol(right_ctx)
         constant_value = None
         if left_symbol and right_symbol and left_symbol.constant_value is not None and right_symbol.constant_value is not None:
             constant_value = bool(left_symbol.constant_value or right_symbol.constant_value)
@@ -9677,7 +9756,7 @@ class SymbolTableVisitor(zincVisitor):
         """Visit range expression."""
         left_info = self._value_info_for_value_context(ctx.expression(0))
         right_info = self._value_info_for_value_context(ctx.expression(1))
-        op = ctx.getChild(1).getText()
+        op = binary_operator(ctx)
         overload = self._resolve_binary_operator(ctx, op, left_info, right_info)
         if overload is not None:
             return overload.base_type
@@ -9689,8 +9768,9 @@ class SymbolTableVisitor(zincVisitor):
 
     def visitMemberAccessExpr(self, ctx: ZincParser.MemberAccessExprContext) -> BaseType:
         """Handle member access."""
-        receiver_type = self.visit(ctx.expression())
-        receiver_symbol = self._expr_symbol(ctx.expression())
+        receiver_ctx = ctx.expression()
+        receiver_type = self.visit(receiver_ctx)
+        receiver_symbol = self._expr_symbol(receiver_ctx)
         member_name = ctx.IDENTIFIER().getText()
         is_direct_call = isinstance(ctx.parentCtx, ZincParser.FunctionCallExprContext) and ctx.parentCtx.expression() is ctx
 
@@ -9901,8 +9981,8 @@ class SymbolTableVisitor(zincVisitor):
                         return resolved_field_type
                     method = next((candidate for candidate in struct.methods if candidate.name == member_name), None)
                     receiver_name = None
-                    if isinstance(ctx.expression(), ZincParser.PrimaryExprContext):
-                        primary = ctx.expression().primaryExpression()
+                    if isinstance(receiver_ctx, ZincParser.PrimaryExprContext):
+                        primary = receiver_ctx.primaryExpression()
                         if primary and primary.IDENTIFIER():
                             receiver_name = primary.IDENTIFIER().getText()
                     if method is not None and receiver_name:
@@ -9990,7 +10070,7 @@ class SymbolTableVisitor(zincVisitor):
             primary = callee_ctx.primaryExpression()
             name_token = None
             if primary is not None:
-                name_token = primary.IDENTIFIER() or (primary.TYPE_KW() if hasattr(primary, "TYPE_KW") else None)
+                name_token = primary.IDENTIFIER() or primary.TYPE_KW()
             if name_token is not None:
                 builtin_name = name_token.getText()
                 args = []
@@ -10068,10 +10148,11 @@ class SymbolTableVisitor(zincVisitor):
         ):
             _tag, meta_value, method_name = callee_symbol.constant_value
             method_args: list[object] = []
-            if ctx.argumentList():
-                raw_args = self._raw_call_arguments(ctx.argumentList())
+            raw_args = self._raw_call_arguments(ctx.argumentList())
+            if raw_args:
                 self._require_positional_arguments(raw_args, f"{method_name}()")
-                for arg_ctx in [arg.expression for arg in raw_args]:
+                for raw_arg in raw_args:
+                    arg_ctx = raw_arg.expression
                     self.visit(arg_ctx)
                     arg_symbol = self._expr_symbol(arg_ctx)
                     method_args.append(arg_symbol.constant_value if arg_symbol else None)
@@ -10262,10 +10343,7 @@ class SymbolTableVisitor(zincVisitor):
                     self.specialization_map[key] = mangled
                     func_instance = self.atlas.functions.get(mangled)
                     if func_instance:
-                        for idx, chan_info in arg_channel_infos.items():
-                            func_instance.arg_channel_infos.setdefault(idx, [])
-                            if all(existing is not chan_info for existing in func_instance.arg_channel_infos[idx]):
-                                func_instance.arg_channel_infos[idx].append(chan_info)
+                        self._record_caller_channel_infos(func_instance, arg_channel_infos)
                     return_info = None
                     if func_instance is not None and func_instance.return_type != BaseType.UNKNOWN:
                         return_info = ResolvedValueInfo(
@@ -11015,10 +11093,7 @@ class SymbolTableVisitor(zincVisitor):
 
                     func_instance = self.atlas.functions.get(mangled)
                     if func_instance:
-                        for idx, chan_info in arg_channel_infos.items():
-                            func_instance.arg_channel_infos.setdefault(idx, [])
-                            if all(existing is not chan_info for existing in func_instance.arg_channel_infos[idx]):
-                                func_instance.arg_channel_infos[idx].append(chan_info)
+                        self._record_caller_channel_infos(func_instance, arg_channel_infos)
                         self._mark_mutated_call_arguments(func_instance, arg_exprs)
                     return_info = None
                     if func_instance and func_instance.return_type != BaseType.UNKNOWN:
@@ -11219,18 +11294,19 @@ class SymbolTableVisitor(zincVisitor):
         ) = self._type_metadata_from_type_ctx(ctx.type_())
         declared_exact_type = self._exact_type_name_from_type_ctx(ctx.type_())
 
-        expr_type = self.visit(ctx.expression())
-        expr_symbol = self._expr_symbol(ctx.expression())
+        expr_ctx = ctx.expression()
+        expr_type = self.visit(expr_ctx)
+        expr_symbol = self._expr_symbol(expr_ctx)
         expr_info = self._value_info_from_symbol(expr_type, expr_symbol)
         if self._try_context_stack and annotated_type not in {BaseType.RESULT, BaseType.OPTION}:
-            expr_info = self._unwrap_try_value(ctx.expression(), expr_info)
+            expr_info = self._unwrap_try_value(expr_ctx, expr_info)
 
         target_ctx = ctx.typedAssignmentTarget()
         tokens = self._typed_assignment_tokens(target_ctx)
         if target_ctx.tupleAssignmentTarget() and expr_info.base_type == BaseType.TUPLE and expr_info.tuple_info is not None:
             if len(tokens) != len(expr_info.tuple_info.element_types):
                 raise ZincTypeError("tuple destructuring arity mismatch")
-            element_exprs = self._tuple_literal_element_exprs(ctx.expression())
+            element_exprs = self._tuple_literal_element_exprs(expr_ctx)
             for i, token in enumerate(tokens):
                 element_info = self._tuple_element_value_info(expr_info.tuple_info, i)
                 element_symbol = None
@@ -11278,7 +11354,7 @@ class SymbolTableVisitor(zincVisitor):
                 declared_exact_type,
                 expr_info,
                 expr_symbol,
-                ctx.expression(),
+                expr_ctx,
             )
 
     def _apply_value_info_to_binding_symbol(self, symbol: Symbol, info: ResolvedValueInfo) -> None:
@@ -11320,23 +11396,23 @@ class SymbolTableVisitor(zincVisitor):
             actual_exact_type=info.exact_type,
             actual_constant_value=self._literal_constant_value_for_expr(expr_ctx, expr_symbol),
             expected_array=self._array_info_from_symbol(existing),
-            actual_array=self._copy_array_info(info.array_info),
+            actual_array=info.array_info,
             expected_dict=existing.dict_info,
-            actual_dict=self._copy_dict_info(info.dict_info),
+            actual_dict=info.dict_info,
             expected_set=existing.set_info,
-            actual_set=self._copy_set_info(info.set_info),
+            actual_set=info.set_info,
             expected_tuple=existing.tuple_info,
-            actual_tuple=self._copy_tuple_info(info.tuple_info),
+            actual_tuple=info.tuple_info,
             expected_callable=existing.callable_info,
-            actual_callable=self._copy_callable_info(info.callable_info),
+            actual_callable=info.callable_info,
             expected_struct_qualified_name=self._struct_qualified_name_for_symbol(existing),
             actual_struct_qualified_name=info.struct_qualified_name,
             expected_anonymous_struct_info=existing.anonymous_struct_info,
-            actual_anonymous_struct_info=self._copy_anonymous_struct_info(info.anonymous_struct_info),
+            actual_anonymous_struct_info=info.anonymous_struct_info,
             expected_result=existing.result_info,
-            actual_result=self._copy_result_info(info.result_info),
+            actual_result=info.result_info,
             expected_option=existing.option_info,
-            actual_option=self._copy_option_info(info.option_info),
+            actual_option=info.option_info,
         )
 
     def _define_assignment_temp_for_binding(
@@ -11472,8 +11548,18 @@ class SymbolTableVisitor(zincVisitor):
         )
         self._apply_value_info_to_binding_symbol(temp, expr_info)
 
+    def _record_caller_channel_infos(self, func_instance: FunctionInstance, arg_channel_infos: dict[int, ChannelTypeInfo]) -> None:
+        """Attach each caller's channel metadata to a specialization, skipping infos already recorded."""
+        for idx, chan_info in arg_channel_infos.items():
+            caller_infos = func_instance.arg_channel_infos.setdefault(idx, [])
+            if not any(existing is chan_info for existing in caller_infos):
+                caller_infos.append(chan_info)
+
     def _mark_mutated_call_arguments(self, func_instance: FunctionInstance, arg_exprs: list) -> None:
         """Mark caller variables as mutable when callee parameters are inferred mutable."""
+        # Only collection parameters can be inferred mutable; scalar-only signatures have nothing to mark.
+        if not (func_instance.arg_array_infos or func_instance.arg_dict_infos or func_instance.arg_set_infos):
+            return
         for i, arg_expr in enumerate(arg_exprs):
             is_mutated = False
             if i in func_instance.arg_array_infos and func_instance.arg_array_infos[i].is_mutated:
@@ -11703,7 +11789,8 @@ class SymbolTableVisitor(zincVisitor):
 
     def visitVariableAssignment(self, ctx: ZincParser.VariableAssignmentContext) -> None:
         """Visit variable assignment with shadowing support."""
-        expr_type = self.visit(ctx.expression())
+        expr_ctx = ctx.expression()
+        expr_type = self.visit(expr_ctx)
         target = ctx.assignmentTarget()
         assignment_op = ctx.assignmentOperator().getText()
 
@@ -11711,11 +11798,11 @@ class SymbolTableVisitor(zincVisitor):
             self._visit_compound_assignment(ctx, expr_type, assignment_op)
             return
 
-        if target.tupleAssignmentTarget() and isinstance(ctx.expression(), ZincParser.ChannelReceiveExprContext):
+        if target.tupleAssignmentTarget() and isinstance(expr_ctx, ZincParser.ChannelReceiveExprContext):
             tokens = self._binding_tokens(target.tupleAssignmentTarget())
             if len(tokens) != 2:
                 raise ZincTypeError("close-aware receive requires exactly two bindings")
-            chan_info = self._channel_info_ref_for_expr(ctx.expression().expression())
+            chan_info = self._channel_info_ref_for_expr(expr_ctx.expression())
             if chan_info is None:
                 raise ZincTypeError("channel receive expects a channel expression")
             if chan_info.element_type == BaseType.ENUM:
@@ -11775,20 +11862,20 @@ class SymbolTableVisitor(zincVisitor):
             var_name = target.IDENTIFIER().getText()
             existing = self.symbols.lookup_by_id(var_name)
 
-            expr_symbol = self._expr_symbol(ctx.expression())
+            expr_symbol = self._expr_symbol(expr_ctx)
             expr_info = self._value_info_from_symbol(expr_type, expr_symbol)
             if self._try_context_stack and expr_type in {BaseType.RESULT, BaseType.OPTION}:
                 if existing is None or existing.resolved_type not in {BaseType.RESULT, BaseType.OPTION}:
-                    expr_info = self._unwrap_try_value(ctx.expression(), expr_info)
+                    expr_info = self._unwrap_try_value(expr_ctx, expr_info)
                     expr_type = expr_info.base_type
 
             if existing is not None and existing.is_captured_ref:
                 self._require_writable_capture(existing, var_name)
 
             # Check if this is a chan() call - track channel info
-            if expr_type == BaseType.CHANNEL and self._is_channel_constructor_call(ctx.expression()):
+            if expr_type == BaseType.CHANNEL and self._is_channel_constructor_call(expr_ctx):
                 existing_chan = self._channel_infos.get(var_name)
-                is_bounded = bool(ctx.expression().argumentList())
+                is_bounded = bool(expr_ctx.argumentList())
                 if existing_chan is None:
                     self._channel_infos[var_name] = ChannelTypeInfo(
                         element_type=BaseType.UNKNOWN,
@@ -11834,7 +11921,7 @@ class SymbolTableVisitor(zincVisitor):
                     expr_type,
                     expected_exact_type=existing.exact_type,
                     actual_exact_type=expr_exact_type,
-                    actual_constant_value=self._literal_constant_value_for_expr(ctx.expression(), expr_symbol),
+                    actual_constant_value=self._literal_constant_value_for_expr(expr_ctx, expr_symbol),
                     expected_array=self._array_info_from_symbol(existing),
                     actual_array=expr_array_info,
                     expected_dict=existing.dict_info,
@@ -11865,7 +11952,7 @@ class SymbolTableVisitor(zincVisitor):
                     expr_type,
                     expected_exact_type=existing.declared_exact_type,
                     actual_exact_type=expr_exact_type,
-                    actual_constant_value=self._literal_constant_value_for_expr(ctx.expression(), expr_symbol),
+                    actual_constant_value=self._literal_constant_value_for_expr(expr_ctx, expr_symbol),
                     expected_array=self._array_info_from_symbol(existing),
                     actual_array=expr_array_info,
                     expected_dict=existing.dict_info,
@@ -12150,7 +12237,7 @@ class SymbolTableVisitor(zincVisitor):
                     exact_type=expr_exact_type,
                 )
                 temp.option_info = self._copy_option_info(existing.option_info)
-            elif expr_type == BaseType.ARRAY and existing.element_type is not None and self._is_empty_array_literal(ctx.expression()):
+            elif expr_type == BaseType.ARRAY and existing.element_type is not None and self._is_empty_array_literal(expr_ctx):
                 # Reassigning empty array to existing array that has element type
                 # This is likely shadowing with a different element type
                 self.symbols.define(
@@ -12215,7 +12302,7 @@ class SymbolTableVisitor(zincVisitor):
                 interval=target.getSourceInterval(),
             )
         elif target.tupleAssignmentTarget():
-            expr_symbol = self._expr_symbol(ctx.expression())
+            expr_symbol = self._expr_symbol(expr_ctx)
             tuple_info = expr_symbol.tuple_info if expr_symbol else None
             if expr_type != BaseType.TUPLE or tuple_info is None:
                 if expr_type == BaseType.UNKNOWN:
@@ -12229,7 +12316,7 @@ class SymbolTableVisitor(zincVisitor):
                     return
                 expr_info = self._value_info_from_symbol(expr_type, expr_symbol)
                 for token in self._binding_tokens(target.tupleAssignmentTarget()):
-                    self._define_broadcast_local_binding(token, ctx, expr_info, expr_symbol, ctx.expression())
+                    self._define_broadcast_local_binding(token, ctx, expr_info, expr_symbol, expr_ctx)
                 return
 
             tokens = self._binding_tokens(target.tupleAssignmentTarget())
@@ -12344,23 +12431,23 @@ class SymbolTableVisitor(zincVisitor):
                     expected_exact_type=existing.declared_exact_type or existing.exact_type,
                     actual_exact_type=result_info.exact_type,
                     expected_array=self._array_info_from_symbol(existing),
-                    actual_array=self._copy_array_info(result_info.array_info),
+                    actual_array=result_info.array_info,
                     expected_dict=existing.dict_info,
-                    actual_dict=self._copy_dict_info(result_info.dict_info),
+                    actual_dict=result_info.dict_info,
                     expected_set=existing.set_info,
-                    actual_set=self._copy_set_info(result_info.set_info),
+                    actual_set=result_info.set_info,
                     expected_tuple=existing.tuple_info,
-                    actual_tuple=self._copy_tuple_info(result_info.tuple_info),
+                    actual_tuple=result_info.tuple_info,
                     expected_callable=existing.callable_info,
-                    actual_callable=self._copy_callable_info(result_info.callable_info),
+                    actual_callable=result_info.callable_info,
                     expected_struct_qualified_name=self._struct_qualified_name_for_symbol(existing),
                     actual_struct_qualified_name=result_info.struct_qualified_name,
                     expected_anonymous_struct_info=existing.anonymous_struct_info,
-                    actual_anonymous_struct_info=self._copy_anonymous_struct_info(result_info.anonymous_struct_info),
+                    actual_anonymous_struct_info=result_info.anonymous_struct_info,
                     expected_result=existing.result_info,
-                    actual_result=self._copy_result_info(result_info.result_info),
+                    actual_result=result_info.result_info,
                     expected_option=existing.option_info,
-                    actual_option=self._copy_option_info(result_info.option_info),
+                    actual_option=result_info.option_info,
                 ):
                     raise ZincTypeError(f"operator '{assignment_op}' result is not assignable to '{var_name}'")
                 existing.is_mutated = True
@@ -13274,157 +13361,36 @@ class SymbolTableVisitor(zincVisitor):
         func_expr = ctx.expression()
         path = extract_identifier_path(func_expr)
 
-        # Collect argument types and track channel arguments
-        arg_types: list[BaseType] = []
-        arg_exact_types: list[str | None] = []
+        # Resolve argument types up front so argument temporaries exist whichever target the spawn binds to
         raw_args = self._raw_call_arguments(ctx.argumentList())
-        arg_exprs = [arg.expression for arg in raw_args]
-        arg_channel_infos: dict[int, ChannelTypeInfo] = {}
-        arg_callable_infos: dict[int, CallableTypeInfo] = {}
-        arg_result_infos: dict[int, ResultTypeInfo] = {}
-        arg_option_infos: dict[int, OptionTypeInfo] = {}
-        arg_struct_qualified_names: dict[int, str] = {}
-        arg_anonymous_struct_infos: dict[int, AnonymousStructTypeInfo] = {}
         if raw_args:
             raw_bound_args = [BoundArgument(arg.expression, arg.name or f"arg_{index}", index) for index, arg in enumerate(raw_args)]
-            (
-                arg_types,
-                arg_exact_types,
-                arg_exprs,
-                arg_channel_infos,
-                _arg_array_infos,
-                _arg_dict_infos,
-                _arg_set_infos,
-                _arg_tuple_infos,
-                arg_callable_infos,
-                arg_result_infos,
-                arg_option_infos,
-                arg_struct_qualified_names,
-                arg_anonymous_struct_infos,
-            ) = self._collect_bound_argument_info(raw_bound_args)
+            self._collect_bound_argument_info(raw_bound_args)
 
         if path and len(path) == 1:
             lexical_function = self._current_lexical_function(path[0])
-            if lexical_function is not None:
-                bound_args = self._bind_call_arguments(
-                    ctx,
-                    self._parameter_specs_from_ctx(lexical_function.ctx, lexical_function.module_id),
-                    f"spawn call to '{lexical_function.display_name}'",
-                )
-                (
-                    arg_types,
-                    arg_exact_types,
-                    arg_exprs,
-                    arg_channel_infos,
-                    _arg_array_infos,
-                    _arg_dict_infos,
-                    _arg_set_infos,
-                    _arg_tuple_infos,
-                    arg_callable_infos,
-                    arg_result_infos,
-                    arg_option_infos,
-                    arg_struct_qualified_names,
-                    arg_anonymous_struct_infos,
-                ) = self._collect_bound_argument_info(bound_args)
-            if lexical_function is not None and BaseType.UNKNOWN not in arg_types:
-                self._validate_annotated_parameters(
-                    lexical_function.ctx,
-                    arg_types,
-                    arg_exact_types,
-                    arg_exprs,
-                    {},
-                    {},
-                    {},
-                    {},
-                    arg_callable_infos,
-                    arg_result_infos,
-                    arg_option_infos,
-                    arg_struct_qualified_names,
-                    arg_anonymous_struct_infos,
-                )
-                mangled = self.atlas.add_specialization(
-                    lexical_function.qualified_name,
-                    arg_types,
-                    arg_exact_types,
-                    lexical_function.ctx,
-                    self._current_function,
-                    arg_channel_infos,
-                    arg_callable_infos=arg_callable_infos,
-                    arg_result_infos=arg_result_infos,
-                    arg_option_infos=arg_option_infos,
-                    arg_struct_qualified_names=arg_struct_qualified_names,
-                    arg_anonymous_struct_infos=arg_anonymous_struct_infos,
-                )
-                key = (self._current_function, ctx.getSourceInterval())
-                self.specialization_map[key] = mangled
-                self.atlas.functions[mangled].is_async = lexical_function.is_async
-                for idx, chan_info in arg_channel_infos.items():
-                    self.atlas.functions[mangled].arg_channel_infos.setdefault(idx, [])
-                    if all(existing is not chan_info for existing in self.atlas.functions[mangled].arg_channel_infos[idx]):
-                        self.atlas.functions[mangled].arg_channel_infos[idx].append(chan_info)
+            if lexical_function is not None and self._specialize_spawn_target(
+                ctx,
+                lexical_function.qualified_name,
+                lexical_function.ctx,
+                lexical_function.module_id,
+                lexical_function.display_name,
+                is_async=lexical_function.is_async,
+            ):
                 return
 
         if path is not None and self._current_module is not None:
             resolved_function = self.module_graph.resolve_function_path(self._current_module, path)
             if resolved_function is not None and resolved_function.name not in ("print", "chan"):
                 func_def = self.atlas.function_defs.get(resolved_function.qualified_name)
-                if func_def is not None:
-                    bound_args = self._bind_call_arguments(
-                        ctx,
-                        self._parameter_specs_from_ctx(func_def, resolved_function.module_id),
-                        f"spawn call to '{resolved_function.name}'",
-                    )
-                    (
-                        arg_types,
-                        arg_exact_types,
-                        arg_exprs,
-                        arg_channel_infos,
-                        _arg_array_infos,
-                        _arg_dict_infos,
-                        _arg_set_infos,
-                        _arg_tuple_infos,
-                        arg_callable_infos,
-                        arg_result_infos,
-                        arg_option_infos,
-                        arg_struct_qualified_names,
-                        arg_anonymous_struct_infos,
-                    ) = self._collect_bound_argument_info(bound_args)
-                if func_def is not None and BaseType.UNKNOWN not in arg_types:
-                    self._validate_annotated_parameters(
-                        func_def,
-                        arg_types,
-                        arg_exact_types,
-                        arg_exprs,
-                        {},
-                        {},
-                        {},
-                        {},
-                        arg_callable_infos,
-                        arg_result_infos,
-                        arg_option_infos,
-                        arg_struct_qualified_names,
-                        arg_anonymous_struct_infos,
-                    )
-                    mangled = self.atlas.add_specialization(
-                        resolved_function.qualified_name,
-                        arg_types,
-                        arg_exact_types,
-                        func_def,
-                        self._current_function,
-                        arg_channel_infos,
-                        arg_callable_infos=arg_callable_infos,
-                        arg_result_infos=arg_result_infos,
-                        arg_option_infos=arg_option_infos,
-                        arg_struct_qualified_names=arg_struct_qualified_names,
-                        arg_anonymous_struct_infos=arg_anonymous_struct_infos,
-                    )
-                    key = (self._current_function, ctx.getSourceInterval())
-                    self.specialization_map[key] = mangled
-                    self.atlas.functions[mangled].is_async = True
-                    for idx, chan_info in arg_channel_infos.items():
-                        self.atlas.functions[mangled].arg_channel_infos.setdefault(idx, [])
-                        if all(existing is not chan_info for existing in self.atlas.functions[mangled].arg_channel_infos[idx]):
-                            self.atlas.functions[mangled].arg_channel_infos[idx].append(chan_info)
+                if func_def is not None and self._specialize_spawn_target(
+                    ctx,
+                    resolved_function.qualified_name,
+                    func_def,
+                    resolved_function.module_id,
+                    resolved_function.name,
+                    is_async=True,
+                ):
                     return
 
         ufcs_type = self._try_resolve_ufcs_call(ctx, func_expr, is_spawn=True)
@@ -13444,6 +13410,76 @@ class SymbolTableVisitor(zincVisitor):
                 raise ZincTypeError("closure captures are not transport-safe for spawn")
             return
 
+    def _specialize_spawn_target(
+        self,
+        ctx: ZincParser.SpawnStatementContext,
+        qualified_name: str,
+        func_ctx: ParserRuleContext,
+        owner_module_id: str,
+        display_name: str,
+        *,
+        is_async: bool,
+    ) -> bool:
+        """Bind a spawn to a known function and record its specialization.
+
+        Returns False when an argument type is still unresolved, leaving the spawn to the generic call paths.
+        """
+        bound_args = self._bind_call_arguments(
+            ctx,
+            self._parameter_specs_from_ctx(func_ctx, owner_module_id),
+            f"spawn call to '{display_name}'",
+        )
+        (
+            arg_types,
+            arg_exact_types,
+            arg_exprs,
+            arg_channel_infos,
+            _arg_array_infos,
+            _arg_dict_infos,
+            _arg_set_infos,
+            _arg_tuple_infos,
+            arg_callable_infos,
+            arg_result_infos,
+            arg_option_infos,
+            arg_struct_qualified_names,
+            arg_anonymous_struct_infos,
+        ) = self._collect_bound_argument_info(bound_args)
+        if BaseType.UNKNOWN in arg_types:
+            return False
+        self._validate_annotated_parameters(
+            func_ctx,
+            arg_types,
+            arg_exact_types,
+            arg_exprs,
+            {},
+            {},
+            {},
+            {},
+            arg_callable_infos,
+            arg_result_infos,
+            arg_option_infos,
+            arg_struct_qualified_names,
+            arg_anonymous_struct_infos,
+        )
+        mangled = self.atlas.add_specialization(
+            qualified_name,
+            arg_types,
+            arg_exact_types,
+            func_ctx,
+            self._current_function,
+            arg_channel_infos,
+            arg_callable_infos=arg_callable_infos,
+            arg_result_infos=arg_result_infos,
+            arg_option_infos=arg_option_infos,
+            arg_struct_qualified_names=arg_struct_qualified_names,
+            arg_anonymous_struct_infos=arg_anonymous_struct_infos,
+        )
+        key = (self._current_function, ctx.getSourceInterval())
+        self.specialization_map[key] = mangled
+        self.atlas.functions[mangled].is_async = is_async
+        self._record_caller_channel_infos(self.atlas.functions[mangled], arg_channel_infos)
+        return True
+
     def visitChannelSendStatement(self, ctx: ZincParser.ChannelSendStatementContext) -> None:
         """Visit channel send statement and infer channel element type."""
         channel_name = ctx.IDENTIFIER().getText()